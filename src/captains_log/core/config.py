@@ -161,6 +161,10 @@ class OptimizationConfig(BaseModel):
         default=True,
         description="Write optimization_status.json for menu bar"
     )
+    status_write_interval_seconds: float = Field(
+        default=1.0, ge=0.1, le=60.0,
+        description="Minimum seconds between status file writes"
+    )
 
 
 class DigestConfig(BaseModel):
@@ -59,6 +59,8 @@ from captains_log.optimization.nudge_system import (
     NudgeSystem,
     NudgeThresholds,
     NudgeState,
+    NudgeQueue,
+    Cooldown,
 )
 
 __all__ = [
@@ -101,4 +103,6 @@ __all__ = [
     "NudgeSystem",
     "NudgeThresholds",
     "NudgeState",
+    "NudgeQueue",
+    "Cooldown",
 ]
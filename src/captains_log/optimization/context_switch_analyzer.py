@@ -382,6 +382,20 @@ class ContextSwitchAnalyzer:
 
         return await self.db.insert("context_switches", switch.to_db_dict())
 
+    async def save_switches(self, switches: list[ContextSwitch]) -> None:
+        """Save several context switches in a single transaction.
+
+        Args:
+            switches: The context switches to save
+        """
+        if not self.db:
+            logger.warning("No database configured for context switch analyzer")
+            return
+
+        await self.db.execute_many(
+            ContextSwitch.INSERT_SQL, [s.to_db_tuple() for s in switches]
+        )
+
     async def get_daily_metrics(
         self, target_date: datetime | None = None
     ) -> ContextSwitchMetrics:
@@ -451,6 +465,34 @@ class ContextSwitchAnalyzer:
 
         return metrics
 
+    async def get_daily_counts(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> dict[str, int]:
+        """Count context switches for every day in a range with one query.
+
+        Args:
+            start_date: First day of the range
+            end_date: Last day of the range (inclusive)
+
+        Returns:
+            Switch counts keyed by ``YYYY-MM-DD``, for days with any
+        """
+        if not self.db:
+            return {}
+
+        rows = await self.db.fetch_all(
+            """
+            SELECT date(timestamp) as day, COUNT(*) as count
+            FROM context_switches
+            WHERE date(timestamp) BETWEEN ? AND ?
+            GROUP BY day
+            """,
+            (start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")),
+        )
+        return {row["day"]: row["count"] for row in rows}
+
     async def get_recent_switch_count(self, minutes: int = 60) -> int:
         """Get the number of context switches in the last N minutes.
 
@@ -487,14 +529,23 @@ class ContextSwitchAnalyzer:
         duration = (datetime.utcnow() - self._context_start).total_seconds()
         return duration / 60.0
 
+    def get_deep_work_duration(self) -> float:
+        """Get the current focus duration if it counts as deep work.
+
+        Returns:
+            Minutes in the current context when it is a productive category
+            held for 25+ minutes, 0.0 otherwise
+        """
+        if self._current_category not in self.PRODUCTIVE_CATEGORIES:
+            return 0.0
+
+        duration = self.get_current_focus_duration()
+        return duration if duration >= 25 else 0.0
+
     def is_in_deep_work(self) -> bool:
         """Check if user is currently in deep work (25+ min focused).
 
         Returns:
             True if in deep work
         """
-        duration = self.get_current_focus_duration()
-        return (
-            duration >= 25 and
-            self._current_category in self.PRODUCTIVE_CATEGORIES
-        )
+        return self.get_deep_work_duration() > 0.0
@@ -420,37 +420,7 @@ class DEALClassifier:
 
         for row in rows:
             app_name = row.get("app_name", "Unknown")
-            window_title = row.get("window_title")
-            url = row.get("url")
-            event_count = row.get("event_count", 1)
-
-            # Estimate duration (rough estimate based on event frequency)
-            # In reality, we should calculate from actual timestamps
-            estimated_minutes = event_count * 0.5  # Assume 30 sec per event
-
-            # Classify the activity
-            result = self.classify_activity(
-                app_name=app_name,
-                window_title=window_title,
-                url=url,
-                duration_seconds=estimated_minutes * 60,
-            )
-
-            # Aggregate by category
-            if result.category == DEALCategory.LEVERAGE:
-                metrics.leverage_minutes += estimated_minutes
-                metrics.leverage_count += 1
-            elif result.category == DEALCategory.DELEGATE:
-                metrics.delegate_minutes += estimated_minutes
-                metrics.delegate_count += 1
-            elif result.category == DEALCategory.ELIMINATE:
-                metrics.eliminate_minutes += estimated_minutes
-                metrics.eliminate_count += 1
-            elif result.category == DEALCategory.AUTOMATE:
-                metrics.automate_minutes += estimated_minutes
-                metrics.automate_count += 1
-            else:
-                metrics.unclassified_minutes += estimated_minutes
+            estimated_minutes = self._tally_activity(metrics, row)
 
             # Track app totals for pattern detection
             app_totals[app_name] = app_totals.get(app_name, 0) + estimated_minutes
@@ -460,6 +430,89 @@ class DEALClassifier:
 
         return metrics
 
+    async def get_metrics_by_day(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> dict[str, DEALMetrics]:
+        """Get DEAL category totals for every day in a range with one query.
+
+        Pattern detection is skipped; use get_daily_metrics for a single
+        day's full breakdown.
+
+        Args:
+            start_date: First day of the range
+            end_date: Last day of the range (inclusive)
+
+        Returns:
+            DEALMetrics keyed by ``YYYY-MM-DD``, for days with activity
+        """
+        if not self.db:
+            return {}
+
+        # Classification is stateful (app frequency feeds AUTOMATE), so rows
+        # are tallied in the same order as successive get_daily_metrics calls
+        rows = await self.db.fetch_all(
+            """
+            SELECT date(timestamp) as day, app_name, window_title, url,
+                   MIN(timestamp) as start_time,
+                   MAX(timestamp) as end_time,
+                   COUNT(*) as event_count
+            FROM activity_logs
+            WHERE date(timestamp) BETWEEN ? AND ?
+            GROUP BY day, app_name, window_title
+            ORDER BY day, start_time
+            """,
+            (start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")),
+        )
+
+        by_day: dict[str, DEALMetrics] = {}
+        for row in rows:
+            metrics = by_day.get(row["day"])
+            if metrics is None:
+                metrics = by_day[row["day"]] = DEALMetrics()
+            self._tally_activity(metrics, row)
+
+        return by_day
+
+    def _tally_activity(self, metrics: DEALMetrics, row: dict[str, Any]) -> float:
+        """Classify one grouped activity row and add it to metrics.
+
+        Returns:
+            The estimated minutes attributed to the row
+        """
+        event_count = int(row.get("event_count", 1))
+
+        # Estimate duration (rough estimate based on event frequency)
+        # In reality, we should calculate from actual timestamps
+        estimated_minutes = event_count * 0.5  # Assume 30 sec per event
+
+        # Classify the activity
+        result = self.classify_activity(
+            app_name=row.get("app_name", "Unknown"),
+            window_title=row.get("window_title"),
+            url=row.get("url"),
+            duration_seconds=estimated_minutes * 60,
+        )
+
+        # Aggregate by category
+        if result.category == DEALCategory.LEVERAGE:
+            metrics.leverage_minutes += estimated_minutes
+            metrics.leverage_count += 1
+        elif result.category == DEALCategory.DELEGATE:
+            metrics.delegate_minutes += estimated_minutes
+            metrics.delegate_count += 1
+        elif result.category == DEALCategory.ELIMINATE:
+            metrics.eliminate_minutes += estimated_minutes
+            metrics.eliminate_count += 1
+        elif result.category == DEALCategory.AUTOMATE:
+            metrics.automate_minutes += estimated_minutes
+            metrics.automate_count += 1
+        else:
+            metrics.unclassified_minutes += estimated_minutes
+
+        return estimated_minutes
+
     def _detect_patterns(
         self,
         app_totals: dict[str, float],
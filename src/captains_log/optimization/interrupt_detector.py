@@ -6,13 +6,18 @@ and tracks the frequency and cost of these interruptions.
 
 from __future__ import annotations
 
+import heapq
 import logging
-from collections import deque
-from dataclasses import dataclass, field
+import time
+from bisect import bisect_right
+from collections import Counter, deque
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta
+from operator import itemgetter
 from typing import Any
 
 from captains_log.optimization.schemas import (
+    INTERRUPT_DURATION_THRESHOLDS,
     InterruptEvent,
     InterruptType,
 )
@@ -89,8 +94,32 @@ DEEP_WORK_BUNDLE_IDS = {
     "com.mitchellh.ghostty",
 }
 
+# Compact (timestamp, app_name, bundle_id, window_title, work_category) record
+ActivityTuple = tuple[datetime, str, str | None, str | None, str | None]
 
-@dataclass
+# How long a recent interrupt count may be served from cache (polling UIs)
+RECENT_COUNT_TTL_SECONDS = 5.0
+
+# Stored interrupt_type value -> enum member, avoiding the Enum constructor per row
+_INTERRUPT_TYPES = {t.value: t for t in InterruptType}
+
+# InterruptType members by ordinal, matching INTERRUPT_DURATION_THRESHOLDS
+_INTERRUPT_TYPE_ORDER = tuple(InterruptType)
+
+
+def _hour_of(timestamp: str) -> int:
+    """Extract the hour from an ISO timestamp string without parsing it.
+
+    Timestamps are stored via ``datetime.isoformat()`` so the hour always
+    sits at characters 11-13. Falls back to a full parse for anything else.
+    """
+    try:
+        return int(timestamp[11:13])
+    except (TypeError, ValueError):
+        return datetime.fromisoformat(timestamp).hour
+
+
+@dataclass(slots=True)
 class ActivityEvent:
     """Represents an app activity event."""
 
@@ -101,7 +130,7 @@ class ActivityEvent:
     work_category: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class InterruptMetrics:
     """Aggregated interrupt metrics for a time period."""
 
@@ -123,25 +152,17 @@ class InterruptMetrics:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
-        return {
-            "total_interrupts": self.total_interrupts,
-            "quick_check_count": self.quick_check_count,
-            "short_response_count": self.short_response_count,
-            "active_communication_count": self.active_communication_count,
-            "deep_communication_count": self.deep_communication_count,
-            "total_interrupt_seconds": self.total_interrupt_seconds,
-            "avg_interrupt_duration_seconds": self.avg_interrupt_duration_seconds,
-            "estimated_context_loss_minutes": self.estimated_context_loss_minutes,
-            "interrupts_per_hour": self.interrupts_per_hour,
-            "peak_interrupt_hours": self.peak_interrupt_hours,
-            "interrupts_by_app": self.interrupts_by_app,
-        }
+        return {name: getattr(self, name) for name in _METRIC_FIELDS}
+
+
+# Field names in declaration order, resolved once for InterruptMetrics.to_dict
+_METRIC_FIELDS = tuple(f.name for f in fields(InterruptMetrics))
 
 
 class InterruptDetector:
     """Detects and tracks interrupts from communication apps."""
 
-    # Context loss estimates by interrupt type (in minutes)
+    # Context loss estimates by interrupt type (in minutes), in enum order
     CONTEXT_LOSS_ESTIMATES = {
         InterruptType.QUICK_CHECK: 1.0,  # Quick glance, minimal loss
         InterruptType.SHORT_RESPONSE: 3.0,  # Reply, some refocus needed
@@ -149,6 +170,9 @@ class InterruptDetector:
         InterruptType.DEEP_COMMUNICATION: 0.0,  # Intentional, not an interrupt
     }
 
+    # Same estimates indexed by InterruptType ordinal (see INTERRUPT_DURATION_THRESHOLDS)
+    _CONTEXT_LOSS_BY_ORDINAL = tuple(CONTEXT_LOSS_ESTIMATES.values())
+
     def __init__(self, db: Any | None = None):
         """Initialize the interrupt detector.
 
@@ -158,19 +182,24 @@ class InterruptDetector:
         self.db = db
 
         # Track recent activity for interrupt detection
-        self._recent_events: deque[ActivityEvent] = deque(maxlen=100)
+        self._recent_events: deque[ActivityTuple] = deque(maxlen=100)
         self._pending_interrupts: list[InterruptEvent] = []
 
         # Current state tracking
         self._current_app: str | None = None
         self._current_app_start: datetime | None = None
+        self._current_app_start_ts: float = 0.0
         self._previous_app: str | None = None
         self._previous_category: str | None = None
 
         # Deep work tracking (for context loss calculation)
         self._deep_work_start: datetime | None = None
+        self._deep_work_start_ts: float = 0.0
         self._in_deep_work: bool = False
 
+        # Short-lived cache for recent interrupt counts: (monotonic time, minutes, count)
+        self._recent_count_cache: tuple[float, int, int] | None = None
+
     def is_communication_app(self, app_name: str, bundle_id: str | None = None) -> bool:
         """Check if an app is a communication app."""
         if app_name in COMMUNICATION_APPS:
@@ -196,41 +225,81 @@ class InterruptDetector:
         Returns:
             InterruptEvent if an interrupt was detected, None otherwise
         """
-        self._recent_events.append(event)
+        return self.on_activity_raw(
+            event.timestamp,
+            event.app_name,
+            event.bundle_id,
+            event.window_title,
+            event.work_category,
+        )
+
+    def on_activity_raw(
+        self,
+        timestamp: datetime,
+        app_name: str,
+        bundle_id: str | None = None,
+        window_title: str | None = None,
+        work_category: str | None = None,
+    ) -> InterruptEvent | None:
+        """Process an activity given as plain fields, without an ActivityEvent.
+
+        This is the allocation-light path used by the optimization engine.
+
+        Returns:
+            InterruptEvent if an interrupt was detected, None otherwise
+        """
+        self._recent_events.append(
+            (timestamp, app_name, bundle_id, window_title, work_category)
+        )
+
+        # Same app (e.g. a heartbeat) - nothing to do
+        if app_name == self._current_app:
+            return None
+
+        # Epoch seconds keep duration math free of timedelta objects
+        ts = timestamp.timestamp()
 
         # Handle first event
         if self._current_app is None:
-            self._current_app = event.app_name
-            self._current_app_start = event.timestamp
-            if self.is_deep_work_app(event.app_name, event.bundle_id):
-                self._deep_work_start = event.timestamp
+            self._current_app = app_name
+            self._current_app_start = timestamp
+            self._current_app_start_ts = ts
+            if self.is_deep_work_app(app_name, bundle_id):
+                self._deep_work_start = timestamp
+                self._deep_work_start_ts = ts
                 self._in_deep_work = True
             return None
 
         # App changed - check for interrupt
-        if event.app_name != self._current_app:
-            interrupt = self._check_for_interrupt(event)
-
-            # Update state
-            self._previous_app = self._current_app
-            self._previous_category = event.work_category
-            self._current_app = event.app_name
-            self._current_app_start = event.timestamp
-
-            # Update deep work tracking
-            if self.is_deep_work_app(event.app_name, event.bundle_id):
-                if not self._in_deep_work:
-                    self._deep_work_start = event.timestamp
-                    self._in_deep_work = True
-            else:
-                self._in_deep_work = False
-                self._deep_work_start = None
-
-            return interrupt
+        interrupt = self._check_for_interrupt(ts, app_name)
+
+        # Update state
+        self._previous_app = self._current_app
+        self._previous_category = work_category
+        self._current_app = app_name
+        self._current_app_start = timestamp
+        self._current_app_start_ts = ts
+
+        # Update deep work tracking
+        if self.is_deep_work_app(app_name, bundle_id):
+            if not self._in_deep_work:
+                self._deep_work_start = timestamp
+                self._deep_work_start_ts = ts
+                self._in_deep_work = True
+        else:
+            self._reset_deep_work()
 
-        return None
+        return interrupt
+
+    def _reset_deep_work(self) -> None:
+        """Clear deep work tracking state."""
+        self._in_deep_work = False
+        self._deep_work_start = None
+        self._deep_work_start_ts = 0.0
 
-    def _check_for_interrupt(self, new_event: ActivityEvent) -> InterruptEvent | None:
+    def _check_for_interrupt(
+        self, timestamp: float, next_app: str
+    ) -> InterruptEvent | None:
         """Check if switching to a communication app constitutes an interrupt.
 
         An interrupt is detected when:
@@ -248,30 +317,38 @@ class InterruptDetector:
 
         if was_in_communication:
             # Just left a communication app - finalize any pending interrupt
-            return self._finalize_interrupt(new_event)
+            return self._finalize_interrupt(timestamp, next_app)
 
         return None
 
-    def _finalize_interrupt(self, next_event: ActivityEvent) -> InterruptEvent | None:
-        """Finalize an interrupt event when leaving a communication app."""
+    def _finalize_interrupt(
+        self, timestamp: float, next_app: str
+    ) -> InterruptEvent | None:
+        """Finalize an interrupt event when leaving a communication app.
+
+        Args:
+            timestamp: Epoch seconds of the event that ended the interrupt
+            next_app: App the user switched to
+        """
         if not self._current_app_start or not self._previous_app:
             return None
 
-        duration = (next_event.timestamp - self._current_app_start).total_seconds()
+        duration = timestamp - self._current_app_start_ts
 
         # Only count as interrupt if it was a quick check (< 15 min)
         # Longer durations are intentional communication, not interrupts
         if duration >= 900:  # 15 minutes
             return None
 
-        interrupt_type = InterruptEvent.classify_interrupt(duration)
-        context_loss = self.CONTEXT_LOSS_ESTIMATES.get(interrupt_type, 1.0)
+        ordinal = bisect_right(INTERRUPT_DURATION_THRESHOLDS, duration)
+        interrupt_type = _INTERRUPT_TYPE_ORDER[ordinal]
+        context_loss = self._CONTEXT_LOSS_BY_ORDINAL[ordinal]
 
         # Increase context loss if interrupted deep work
         if self._in_deep_work and self._deep_work_start:
             deep_work_duration = (
-                self._current_app_start - self._deep_work_start
-            ).total_seconds() / 60.0
+                self._current_app_start_ts - self._deep_work_start_ts
+            ) / 60.0
             # Higher cost for interrupting longer deep work sessions
             if deep_work_duration > 25:
                 context_loss *= 2.0
@@ -283,7 +360,7 @@ class InterruptDetector:
             interrupt_app=self._current_app or "",
             duration_seconds=duration,
             previous_app=self._previous_app or "",
-            next_app=next_event.app_name,
+            next_app=next_app,
             interrupt_type=interrupt_type,
             context_loss_estimate=context_loss,
             work_context_before=self._previous_category or "",
@@ -309,8 +386,24 @@ class InterruptDetector:
             logger.warning("No database configured for interrupt detector")
             return 0
 
+        self._recent_count_cache = None
         return await self.db.insert("interrupts", interrupt.to_db_dict())
 
+    async def save_interrupts(self, interrupts: list[InterruptEvent]) -> None:
+        """Save several interrupt events in a single transaction.
+
+        Args:
+            interrupts: The interrupt events to save
+        """
+        if not self.db:
+            logger.warning("No database configured for interrupt detector")
+            return
+
+        self._recent_count_cache = None
+        await self.db.execute_many(
+            InterruptEvent.INSERT_SQL, [i.to_db_tuple() for i in interrupts]
+        )
+
     async def get_daily_metrics(self, target_date: datetime | None = None) -> InterruptMetrics:
         """Get interrupt metrics for a specific day.
 
@@ -326,34 +419,33 @@ class InterruptDetector:
         target_date = target_date or datetime.utcnow()
         date_str = target_date.strftime("%Y-%m-%d")
 
-        # Query interrupts for the day
-        rows = await self.db.fetch_all(
+        metrics = InterruptMetrics()
+        type_counts: Counter[InterruptType] = Counter()
+        hourly_counts: Counter[int] = Counter()
+        app_counts: Counter[str] = Counter()
+
+        # Stream interrupts for the day rather than materializing them all
+        rows = self.db.iterate(
             """
-            SELECT * FROM interrupts
+            SELECT timestamp, interrupt_app, duration_seconds,
+                   interrupt_type, context_loss_estimate
+            FROM interrupts
             WHERE date(timestamp) = ?
             ORDER BY timestamp
             """,
             (date_str,),
         )
 
-        metrics = InterruptMetrics()
-        hourly_counts: dict[int, int] = {}
-
-        for row in rows:
+        async for row in rows:
             metrics.total_interrupts += 1
             duration = row.get("duration_seconds", 0)
             metrics.total_interrupt_seconds += duration
 
             # Classify and count
-            interrupt_type = InterruptType(row.get("interrupt_type", "quick_check"))
-            if interrupt_type == InterruptType.QUICK_CHECK:
-                metrics.quick_check_count += 1
-            elif interrupt_type == InterruptType.SHORT_RESPONSE:
-                metrics.short_response_count += 1
-            elif interrupt_type == InterruptType.ACTIVE_COMMUNICATION:
-                metrics.active_communication_count += 1
-            else:
-                metrics.deep_communication_count += 1
+            interrupt_type = _INTERRUPT_TYPES.get(
+                row.get("interrupt_type"), InterruptType.QUICK_CHECK
+            )
+            type_counts[interrupt_type] += 1
 
             # Context loss
             context_loss = row.get("context_loss_estimate", 0)
@@ -361,12 +453,16 @@ class InterruptDetector:
 
             # By app
             app = row.get("interrupt_app", "Unknown")
-            metrics.interrupts_by_app[app] = metrics.interrupts_by_app.get(app, 0) + 1
+            app_counts[app] += 1
 
             # Hourly distribution
-            ts = datetime.fromisoformat(row["timestamp"])
-            hour = ts.hour
-            hourly_counts[hour] = hourly_counts.get(hour, 0) + 1
+            hourly_counts[_hour_of(row["timestamp"])] += 1
+
+        metrics.quick_check_count = type_counts[InterruptType.QUICK_CHECK]
+        metrics.short_response_count = type_counts[InterruptType.SHORT_RESPONSE]
+        metrics.active_communication_count = type_counts[InterruptType.ACTIVE_COMMUNICATION]
+        metrics.deep_communication_count = type_counts[InterruptType.DEEP_COMMUNICATION]
+        metrics.interrupts_by_app = dict(app_counts)
 
         # Calculate averages
         if metrics.total_interrupts > 0:
@@ -378,11 +474,39 @@ class InterruptDetector:
         metrics.interrupts_per_hour = metrics.total_interrupts / 8.0
 
         # Find peak hours (top 3)
-        sorted_hours = sorted(hourly_counts.items(), key=lambda x: x[1], reverse=True)
-        metrics.peak_interrupt_hours = [h for h, _ in sorted_hours[:3]]
+        top_hours = heapq.nlargest(3, hourly_counts.items(), key=itemgetter(1))
+        metrics.peak_interrupt_hours = [h for h, _ in top_hours]
 
         return metrics
 
+    async def get_daily_counts(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> dict[str, int]:
+        """Count interrupts for every day in a range with one query.
+
+        Args:
+            start_date: First day of the range
+            end_date: Last day of the range (inclusive)
+
+        Returns:
+            Interrupt counts keyed by ``YYYY-MM-DD``, for days with any
+        """
+        if not self.db:
+            return {}
+
+        rows = await self.db.fetch_all(
+            """
+            SELECT date(timestamp) as day, COUNT(*) as count
+            FROM interrupts
+            WHERE date(timestamp) BETWEEN ? AND ?
+            GROUP BY day
+            """,
+            (start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")),
+        )
+        return {row["day"]: row["count"] for row in rows}
+
     async def get_recent_interrupt_count(self, minutes: int = 30) -> int:
         """Get the number of interrupts in the last N minutes.
 
@@ -395,6 +519,11 @@ class InterruptDetector:
         if not self.db:
             return 0
 
+        cached = self._recent_count_cache
+        if cached and cached[1] == minutes:
+            if time.monotonic() - cached[0] < RECENT_COUNT_TTL_SECONDS:
+                return cached[2]
+
         cutoff = datetime.utcnow() - timedelta(minutes=minutes)
 
         result = await self.db.fetch_one(
@@ -405,7 +534,9 @@ class InterruptDetector:
             (cutoff.isoformat(),),
         )
 
-        return result["count"] if result else 0
+        count = result["count"] if result else 0
+        self._recent_count_cache = (time.monotonic(), minutes, count)
+        return count
 
     async def should_nudge_interrupt_frequency(
         self, threshold_per_hour: float = 4.0
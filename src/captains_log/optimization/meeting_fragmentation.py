@@ -11,9 +11,13 @@ Key concept: A day with 4 hours of meetings could have:
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass, field
+import sys
+from bisect import bisect_right
+from collections import OrderedDict, defaultdict
+from dataclasses import InitVar, dataclass, field, fields, replace
 from datetime import datetime, timedelta, time
-from typing import Any
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
 
 logger = logging.getLogger(__name__)
 
@@ -34,15 +38,100 @@ MEETING_BUNDLE_IDS = {
     "com.skype.skype",
 }
 
+# App names and bundle IDs in one set, so either key is a single lookup
+_MEETING_KEYS = frozenset(MEETING_APPS) | frozenset(MEETING_BUNDLE_IDS)
+
+# Meeting runs for a range of days: consecutive meeting-app rows collapsed
+# into one row with the run's day, first/last timestamp and first app.
+# run_id only advances on non-meeting rows (and restarts each day), so
+# meetings separated by other activity stay separate.
+_MEETING_KEY_PARAMS = tuple(sorted(_MEETING_KEYS))
+_MEETING_KEY_PLACEHOLDERS = ", ".join("?" * len(_MEETING_KEY_PARAMS))
+# Keys bound for both IN lists (app_name, then bundle_id), built once
+_MEETING_QUERY_KEY_PARAMS = _MEETING_KEY_PARAMS * 2
+_MEETING_RUNS_QUERY = f"""
+    SELECT day, MIN(timestamp) AS start, MAX(timestamp) AS end,
+           MIN(first_app) AS app_name
+    FROM (
+        SELECT day, run_id, timestamp,
+               FIRST_VALUE(app_name) OVER (
+                   PARTITION BY day, run_id ORDER BY timestamp, id
+               ) AS first_app
+        FROM (
+            SELECT id, day, app_name, timestamp, is_meeting,
+                   SUM(1 - is_meeting) OVER (
+                       PARTITION BY day ORDER BY timestamp, id
+                   ) AS run_id
+            FROM (
+                SELECT id, date(timestamp) AS day, app_name, timestamp,
+                       CASE WHEN app_name IN ({_MEETING_KEY_PLACEHOLDERS})
+                              OR bundle_id IN ({_MEETING_KEY_PLACEHOLDERS})
+                            THEN 1 ELSE 0 END AS is_meeting
+                FROM activity_logs
+                WHERE date(timestamp) BETWEEN ? AND ?
+            )
+        )
+        WHERE is_meeting = 1
+    )
+    GROUP BY day, run_id
+    ORDER BY start
+"""
+
 # Minimum duration to consider as a meeting (in minutes)
 MIN_MEETING_DURATION = 5
 
+# Gap size boundaries (minutes) and the gap type for each resulting bucket:
+# < 5 is tiny, 5-30 is fragmented, 30+ is usable
+GAP_THRESHOLDS = (5.0, 30.0)
+GAP_TYPES = ("tiny", "fragmented", "usable")
+_FRAGMENTED = 1
+_USABLE = 2
+
+# Reads TimeBlock.duration_minutes without a Python-level generator frame
+_duration_minutes = attrgetter("duration_minutes")
+
+# Number of past-day analyses kept by each analyzer
+DAY_CACHE_SIZE = 64
+
 # Work hours (configurable)
 DEFAULT_WORK_START = time(9, 0)
 DEFAULT_WORK_END = time(18, 0)
 
+# Reference point for turning naive UTC timestamps into float seconds
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _epoch_seconds(dt: datetime) -> float:
+    """Seconds since the epoch for a naive (UTC) timestamp."""
+    return (dt - _EPOCH).total_seconds()
+
+
+def _tally_gaps(
+    gap_minutes: list[float],
+) -> tuple[list[int], list[int], list[float], float]:
+    """Bucket gap lengths and total them per bucket.
+
+    Works on plain floats only, so the numeric pass stays separate from
+    TimeBlock/datetime handling.
+
+    Returns:
+        (bucket per gap, count per bucket, minutes per bucket, largest usable gap)
+    """
+    buckets = [bisect_right(GAP_THRESHOLDS, minutes) for minutes in gap_minutes]
+    counts = [0, 0, 0]
+    totals = [0.0, 0.0, 0.0]
+    largest_usable = 0.0
 
-@dataclass
+    for bucket, minutes in zip(buckets, gap_minutes):
+        counts[bucket] += 1
+        totals[bucket] += minutes
+        if bucket == _USABLE and minutes > largest_usable:
+            largest_usable = minutes
+
+    return buckets, counts, totals, largest_usable
+
+
+@dataclass(slots=True)
 class TimeBlock:
     """A block of time in the schedule."""
 
@@ -66,7 +155,7 @@ class TimeBlock:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class FragmentationMetrics:
     """Metrics for meeting fragmentation analysis."""
 
@@ -95,31 +184,82 @@ class FragmentationMetrics:
     consolidation_possible: bool = False
     suggested_meeting_days: list[str] = field(default_factory=list)
 
-    # Block details
-    time_blocks: list[TimeBlock] = field(default_factory=list)
+    # Block details: gap blocks are only built when time_blocks is read.
+    # At runtime time_blocks is an InitVar for __init__ and a property
+    # attached after the class body; type checkers see a plain field.
+    if TYPE_CHECKING:
+        time_blocks: list[TimeBlock] = field(default_factory=list)
+    else:
+        time_blocks: InitVar[list[TimeBlock] | None] = None
+    _meeting_blocks: list[TimeBlock] = field(default_factory=list, init=False, repr=False)
+    _gap_spans: list[tuple[datetime, datetime, int, float]] = field(
+        default_factory=list, init=False, repr=False
+    )
+    _time_blocks: list[TimeBlock] | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self, time_blocks: list[TimeBlock] | None = None) -> None:
+        self._time_blocks = time_blocks
+
+    def _get_time_blocks(self) -> list[TimeBlock]:
+        """All meeting and gap blocks, for visualization."""
+        if self._time_blocks is None:
+            self._time_blocks = self._meeting_blocks + [
+                TimeBlock(
+                    start=start,
+                    end=end,
+                    block_type=GAP_TYPES[bucket],
+                    duration_minutes=minutes,
+                )
+                for start, end, bucket, minutes in self._gap_spans
+            ]
+        return self._time_blocks
+
+    def _set_time_blocks(self, blocks: list[TimeBlock]) -> None:
+        self._time_blocks = blocks
+
+    def copy(self) -> FragmentationMetrics:
+        """Return an independent copy; no lists or blocks are shared."""
+        clone = FragmentationMetrics(
+            **{name: getattr(self, name) for name in _FRAGMENTATION_FIELDS}
+        )
+        clone.suggested_meeting_days = list(self.suggested_meeting_days)
+        clone._meeting_blocks = [replace(block) for block in self._meeting_blocks]
+        clone._gap_spans = list(self._gap_spans)
+        if self._time_blocks is not None:
+            clone._time_blocks = [replace(block) for block in self._time_blocks]
+        return clone
 
     def to_dict(self) -> dict[str, Any]:
-        return {
-            "total_meetings": self.total_meetings,
-            "total_meeting_minutes": self.total_meeting_minutes,
-            "avg_meeting_duration": self.avg_meeting_duration,
-            "back_to_back_meetings": self.back_to_back_meetings,
-            "swiss_cheese_score": self.swiss_cheese_score,
-            "usable_blocks": self.usable_blocks,
-            "fragmented_blocks": self.fragmented_blocks,
-            "tiny_gaps": self.tiny_gaps,
-            "largest_focus_block_minutes": self.largest_focus_block_minutes,
-            "total_usable_minutes": self.total_usable_minutes,
-            "total_fragmented_minutes": self.total_fragmented_minutes,
-            "meeting_hours": self.meeting_hours,
-            "focus_hours": self.focus_hours,
-            "consolidation_possible": self.consolidation_possible,
-            "suggested_meeting_days": self.suggested_meeting_days,
-            "time_blocks": [b.to_dict() for b in self.time_blocks],
+        data = {name: getattr(self, name) for name in _FRAGMENTATION_FIELDS}
+
+        # Blocks are serialized column-wise: one list per TimeBlock field
+        blocks = self._get_time_blocks()
+        data["time_blocks"] = {
+            "start": [b.start.isoformat() for b in blocks],
+            "end": [b.end.isoformat() for b in blocks],
+            "block_type": [b.block_type for b in blocks],
+            "app_name": [b.app_name for b in blocks],
+            "duration_minutes": [b.duration_minutes for b in blocks],
         }
+        return data
+
 
+setattr(
+    FragmentationMetrics,
+    "time_blocks",
+    property(
+        FragmentationMetrics._get_time_blocks,
+        FragmentationMetrics._set_time_blocks,
+        doc=FragmentationMetrics._get_time_blocks.__doc__,
+    ),
+)
 
-@dataclass
+# Public (init) fields in declaration order, resolved once for to_dict;
+# fields() leaves out the time_blocks InitVar
+_FRAGMENTATION_FIELDS = tuple(f.name for f in fields(FragmentationMetrics) if f.init)
+
+
+@dataclass(slots=True)
 class WeeklyFragmentationMetrics:
     """Weekly fragmentation summary."""
 
@@ -132,15 +272,16 @@ class WeeklyFragmentationMetrics:
     total_focus_hours: float = 0.0
 
     def to_dict(self) -> dict[str, Any]:
-        return {
-            "days": {k: v.to_dict() for k, v in self.days.items()},
-            "avg_swiss_cheese_score": self.avg_swiss_cheese_score,
-            "best_focus_day": self.best_focus_day,
-            "worst_focus_day": self.worst_focus_day,
-            "total_meetings": self.total_meetings,
-            "total_meeting_hours": self.total_meeting_hours,
-            "total_focus_hours": self.total_focus_hours,
-        }
+        data: dict[str, Any] = {"days": {k: v.to_dict() for k, v in self.days.items()}}
+        for name in _WEEKLY_SUMMARY_FIELDS:
+            data[name] = getattr(self, name)
+        return data
+
+
+# Scalar summary fields (everything but days), resolved once for to_dict
+_WEEKLY_SUMMARY_FIELDS = tuple(
+    f.name for f in fields(WeeklyFragmentationMetrics) if f.name != "days"
+)
 
 
 class MeetingFragmentationAnalyzer:
@@ -162,14 +303,19 @@ class MeetingFragmentationAnalyzer:
         self.db = db
         self.work_start = work_start
         self.work_end = work_end
+        self._work_minutes = (
+            (work_end.hour * 60 + work_end.minute)
+            - (work_start.hour * 60 + work_start.minute)
+        )
+
+        # Past-day results keyed by (date, last activity id that day), LRU order
+        self._day_cache: OrderedDict[tuple[str, int], FragmentationMetrics] = OrderedDict()
 
     def is_meeting_app(self, app_name: str, bundle_id: str | None = None) -> bool:
         """Check if an app is a meeting app."""
-        if app_name in MEETING_APPS:
-            return True
-        if bundle_id and bundle_id in MEETING_BUNDLE_IDS:
-            return True
-        return False
+        return app_name in _MEETING_KEYS or (
+            bundle_id is not None and bundle_id in _MEETING_KEYS
+        )
 
     async def analyze_day(
         self,
@@ -187,29 +333,87 @@ class MeetingFragmentationAnalyzer:
             return FragmentationMetrics()
 
         target_date = target_date or datetime.utcnow()
-        date_str = target_date.strftime("%Y-%m-%d")
+        return (await self._analyze_days(target_date, 1))[0]
+
+    async def _analyze_days(
+        self,
+        first_day: datetime,
+        num_days: int,
+    ) -> list[FragmentationMetrics]:
+        """Analyze consecutive days with one activity query for the whole range.
+
+        Args:
+            first_day: The first date to analyze
+            num_days: Number of consecutive days
+
+        Returns:
+            FragmentationMetrics per day, in date order
+        """
+        if not self.db:
+            return [FragmentationMetrics() for _ in range(num_days)]
+
+        days = [first_day + timedelta(days=i) for i in range(num_days)]
+        first_str = days[0].strftime("%Y-%m-%d")
+        last_str = days[-1].strftime("%Y-%m-%d")
 
-        # Get all activities for the day
-        rows = await self.db.fetch_all(
+        # Index-only probe: which days have activity, and the latest row id of
+        # each. Empty days (weekends, vacations) are known upfront, and the id
+        # tells whether a cached result is still current.
+        active_rows = await self.db.fetch_all(
             """
-            SELECT app_name, bundle_id, timestamp
+            SELECT date(timestamp) AS day, MAX(id) AS last_id
             FROM activity_logs
-            WHERE date(timestamp) = ?
-            ORDER BY timestamp
+            WHERE date(timestamp) BETWEEN ? AND ?
+            GROUP BY day
             """,
-            (date_str,),
+            (first_str, last_str),
         )
+        last_ids = {row["day"]: row["last_id"] for row in active_rows}
+        today_str = datetime.utcnow().strftime("%Y-%m-%d")
+
+        results: dict[str, FragmentationMetrics] = {}
+        pending: list[datetime] = []
+        for day in days:
+            date_str = day.strftime("%Y-%m-%d")
+            if date_str not in last_ids:
+                results[date_str] = FragmentationMetrics()
+                continue
+            cached = self._day_cache.get((date_str, last_ids[date_str]))
+            if cached is not None and date_str != today_str:
+                self._day_cache.move_to_end((date_str, last_ids[date_str]))
+                # Callers get their own copy so edits never reach the cache
+                results[date_str] = cached.copy()
+            else:
+                pending.append(day)
+
+        if pending:
+            # Only meeting runs come back, one row per run
+            rows = await self.db.fetch_all(
+                _MEETING_RUNS_QUERY,
+                (
+                    *_MEETING_QUERY_KEY_PARAMS,
+                    pending[0].strftime("%Y-%m-%d"),
+                    pending[-1].strftime("%Y-%m-%d"),
+                ),
+            )
+            rows_by_day: dict[str, list[dict]] = defaultdict(list)
+            for row in rows:
+                rows_by_day[row["day"]].append(row)
 
-        if not rows:
-            return FragmentationMetrics()
+            for day in pending:
+                date_str = day.strftime("%Y-%m-%d")
 
-        # Detect meeting blocks
-        meetings = self._detect_meeting_blocks(rows)
+                # Detect meeting blocks, then analyze gaps between them
+                meetings = self._detect_meeting_blocks(rows_by_day.get(date_str, []))
+                metrics = self._analyze_fragmentation(meetings, day)
+                results[date_str] = metrics
 
-        # Analyze gaps between meetings
-        metrics = self._analyze_fragmentation(meetings, target_date)
+                if date_str != today_str:
+                    self._day_cache[(date_str, last_ids[date_str])] = metrics.copy()
+                    if len(self._day_cache) > DAY_CACHE_SIZE:
+                        self._day_cache.popitem(last=False)
 
-        return metrics
+        return [results[day.strftime("%Y-%m-%d")] for day in days]
 
     def _detect_meeting_blocks(
         self,
@@ -217,59 +421,23 @@ class MeetingFragmentationAnalyzer:
     ) -> list[TimeBlock]:
         """Detect meeting blocks from activity data.
 
-        Consecutive meeting app usage is grouped into single meeting blocks.
+        Expects one row per run of consecutive meeting-app usage (see
+        _MEETING_RUNS_QUERY), so each row is a candidate meeting block.
         """
         meetings: list[TimeBlock] = []
-        current_meeting: dict | None = None
-
-        for i, row in enumerate(activity_rows):
-            app_name = row.get("app_name", "")
-            bundle_id = row.get("bundle_id")
-            timestamp = datetime.fromisoformat(row["timestamp"])
-
-            is_meeting = self.is_meeting_app(app_name, bundle_id)
-
-            if is_meeting:
-                if current_meeting is None:
-                    # Start new meeting
-                    current_meeting = {
-                        "start": timestamp,
-                        "end": timestamp,
-                        "app_name": app_name,
-                    }
-                else:
-                    # Extend current meeting
-                    current_meeting["end"] = timestamp
-            else:
-                if current_meeting is not None:
-                    # End current meeting
-                    duration = (
-                        current_meeting["end"] - current_meeting["start"]
-                    ).total_seconds() / 60.0
-
-                    # Only count if longer than minimum
-                    if duration >= MIN_MEETING_DURATION:
-                        meetings.append(TimeBlock(
-                            start=current_meeting["start"],
-                            end=current_meeting["end"],
-                            block_type="meeting",
-                            app_name=current_meeting["app_name"],
-                        ))
-
-                    current_meeting = None
-
-        # Handle meeting that extends to end of data
-        if current_meeting is not None:
-            duration = (
-                current_meeting["end"] - current_meeting["start"]
-            ).total_seconds() / 60.0
-
-            if duration >= MIN_MEETING_DURATION:
+
+        for row in activity_rows:
+            start = datetime.fromisoformat(row["start"])
+            end = datetime.fromisoformat(row["end"])
+
+            # Only count if longer than minimum
+            if (end - start).total_seconds() / 60.0 >= MIN_MEETING_DURATION:
                 meetings.append(TimeBlock(
-                    start=current_meeting["start"],
-                    end=current_meeting["end"],
+                    start=start,
+                    end=end,
                     block_type="meeting",
-                    app_name=current_meeting["app_name"],
+                    # Meeting apps repeat across days; share one string per app
+                    app_name=sys.intern(row.get("app_name") or ""),
                 ))
 
         return meetings
@@ -284,10 +452,7 @@ class MeetingFragmentationAnalyzer:
 
         if not meetings:
             # No meetings = no fragmentation
-            work_hours = (
-                datetime.combine(target_date.date(), self.work_end) -
-                datetime.combine(target_date.date(), self.work_start)
-            ).total_seconds() / 3600.0
+            work_hours = self._work_minutes / 60.0
             metrics.focus_hours = work_hours
             metrics.total_usable_minutes = work_hours * 60
             metrics.largest_focus_block_minutes = work_hours * 60
@@ -295,7 +460,7 @@ class MeetingFragmentationAnalyzer:
 
         # Calculate meeting stats
         metrics.total_meetings = len(meetings)
-        total_meeting_minutes = sum(m.duration_minutes for m in meetings)
+        total_meeting_minutes = sum(map(_duration_minutes, meetings))
         metrics.total_meeting_minutes = total_meeting_minutes
         metrics.meeting_hours = total_meeting_minutes / 60.0
 
@@ -304,65 +469,55 @@ class MeetingFragmentationAnalyzer:
                 total_meeting_minutes / metrics.total_meetings
             )
 
-        # Sort meetings by start time
-        meetings = sorted(meetings, key=lambda m: m.start)
+        # Meetings arrive in start order (the runs query orders by start)
+        assert all(a.start <= b.start for a, b in zip(meetings, meetings[1:]))
+
+        # Work day bounds and meeting edges as epoch seconds, so gap math is
+        # plain float arithmetic
+        work_start_dt = datetime.combine(target_date.date(), self.work_start)
+        work_end_dt = datetime.combine(target_date.date(), self.work_end)
+        work_start_ts = _epoch_seconds(work_start_dt)
+        work_end_ts = _epoch_seconds(work_end_dt)
+        starts = [_epoch_seconds(m.start) for m in meetings]
+        ends = [_epoch_seconds(m.end) for m in meetings]
 
-        # Analyze gaps between meetings
-        gaps: list[TimeBlock] = []
+        # Find gaps: before the first meeting, between meetings, after the last
+        spans: list[tuple[datetime, datetime]] = []
+        gap_minutes: list[float] = []
 
         # Gap before first meeting (from work start)
-        work_start_dt = datetime.combine(
-            target_date.date(), self.work_start
-        )
-        if meetings[0].start > work_start_dt:
-            gap_minutes = (meetings[0].start - work_start_dt).total_seconds() / 60.0
-            gaps.append(TimeBlock(
-                start=work_start_dt,
-                end=meetings[0].start,
-                block_type=self._classify_gap(gap_minutes),
-            ))
+        if starts[0] > work_start_ts:
+            spans.append((work_start_dt, meetings[0].start))
+            gap_minutes.append((starts[0] - work_start_ts) / 60.0)
 
         # Gaps between meetings
         for i in range(len(meetings) - 1):
-            gap_start = meetings[i].end
-            gap_end = meetings[i + 1].start
-            gap_minutes = (gap_end - gap_start).total_seconds() / 60.0
-
-            if gap_minutes > 0:
-                gaps.append(TimeBlock(
-                    start=gap_start,
-                    end=gap_end,
-                    block_type=self._classify_gap(gap_minutes),
-                ))
+            minutes = (starts[i + 1] - ends[i]) / 60.0
+
+            if minutes > 0:
+                spans.append((meetings[i].end, meetings[i + 1].start))
+                gap_minutes.append(minutes)
 
             # Check for back-to-back (< 5 min gap)
-            if gap_minutes < 5:
+            if minutes < 5:
                 metrics.back_to_back_meetings += 1
 
         # Gap after last meeting (until work end)
-        work_end_dt = datetime.combine(
-            target_date.date(), self.work_end
-        )
-        if meetings[-1].end < work_end_dt:
-            gap_minutes = (work_end_dt - meetings[-1].end).total_seconds() / 60.0
-            gaps.append(TimeBlock(
-                start=meetings[-1].end,
-                end=work_end_dt,
-                block_type=self._classify_gap(gap_minutes),
-            ))
-
-        # Categorize gaps
-        for gap in gaps:
-            if gap.block_type == "usable":
-                metrics.usable_blocks += 1
-                metrics.total_usable_minutes += gap.duration_minutes
-                if gap.duration_minutes > metrics.largest_focus_block_minutes:
-                    metrics.largest_focus_block_minutes = gap.duration_minutes
-            elif gap.block_type == "fragmented":
-                metrics.fragmented_blocks += 1
-                metrics.total_fragmented_minutes += gap.duration_minutes
-            elif gap.block_type == "tiny":
-                metrics.tiny_gaps += 1
+        if ends[-1] < work_end_ts:
+            spans.append((meetings[-1].end, work_end_dt))
+            gap_minutes.append((work_end_ts - ends[-1]) / 60.0)
+
+        # Bucket gaps by size (indices follow GAP_TYPES)
+        buckets, bucket_counts, bucket_minutes, largest_usable = _tally_gaps(gap_minutes)
+
+        metrics._gap_spans = [
+            (start, end, bucket, minutes)
+            for (start, end), bucket, minutes in zip(spans, buckets, gap_minutes)
+        ]
+        metrics.tiny_gaps, metrics.fragmented_blocks, metrics.usable_blocks = bucket_counts
+        metrics.total_fragmented_minutes = bucket_minutes[_FRAGMENTED]
+        metrics.total_usable_minutes = bucket_minutes[_USABLE]
+        metrics.largest_focus_block_minutes = largest_usable
 
         # Calculate Swiss Cheese Score
         # Score = fragmented_time / (fragmented_time + usable_time)
@@ -376,8 +531,8 @@ class MeetingFragmentationAnalyzer:
         # Focus hours (usable blocks only)
         metrics.focus_hours = metrics.total_usable_minutes / 60.0
 
-        # Store all blocks for visualization
-        metrics.time_blocks = meetings + gaps
+        # Keep blocks for visualization; gap TimeBlocks are built lazily
+        metrics._meeting_blocks = meetings
 
         # Check if consolidation is possible
         # If more than 2 meetings with fragmented gaps, consolidation helps
@@ -395,12 +550,7 @@ class MeetingFragmentationAnalyzer:
         Returns:
             "usable" (30+ min), "fragmented" (5-30 min), or "tiny" (< 5 min)
         """
-        if gap_minutes >= 30:
-            return "usable"
-        elif gap_minutes >= 5:
-            return "fragmented"
-        else:
-            return "tiny"
+        return GAP_TYPES[bisect_right(GAP_THRESHOLDS, gap_minutes)]
 
     async def analyze_week(
         self,
@@ -425,10 +575,10 @@ class MeetingFragmentationAnalyzer:
         best_score = 1.0
         worst_score = 0.0
 
-        for i, day_name in enumerate(day_names):
-            day_date = week_start + timedelta(days=i)
-            metrics = await self.analyze_day(day_date)
+        # One query covers the whole week; rows are then split per day
+        results = await self._analyze_days(week_start, len(day_names))
 
+        for day_name, metrics in zip(day_names, results):
             weekly.days[day_name] = metrics
             weekly.total_meetings += metrics.total_meetings
             weekly.total_meeting_hours += metrics.meeting_hours
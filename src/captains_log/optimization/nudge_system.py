@@ -16,6 +16,11 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import os
+import time
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -25,8 +30,188 @@ from captains_log.optimization.schemas import Nudge, NudgeType, OptimizationStat
 
 logger = logging.getLogger(__name__)
 
+# Minimum spacing between status file writes; bursts of events inside
+# this window are coalesced into one write.
+MIN_STATUS_WRITE_INTERVAL_SECONDS = 1.0
+
+# Queued nudges are inserted together once this many are pending, or this
+# long after the first one was queued, whichever comes first.
+NUDGE_FLUSH_BATCH_SIZE = 16
+NUDGE_FLUSH_DELAY_SECONDS = 0.5
+
+# Only the most recent nudges are kept in memory; older ones live in the db
+MAX_PENDING_NUDGES = 64
+
+# Estimated refocus cost charged per context switch in the status output
+SWITCH_COST_ESTIMATE_MINUTES = 2.0
+
+# nudge_history statements. sqlite3 keeps compiled statements in a
+# per-connection cache keyed by SQL text, so reusing these exact strings
+# means each one is parsed and planned only once.
+_ACKNOWLEDGE_NUDGE_SQL = "UPDATE nudge_history SET acknowledged_at_ms = ? WHERE id = ?"
+_DISMISS_NUDGE_SQL = "UPDATE nudge_history SET dismissed_at_ms = ? WHERE id = ?"
+_RECENT_NUDGES_SQL = """
+    SELECT * FROM nudge_history
+    WHERE timestamp > ?
+    ORDER BY timestamp DESC
+    LIMIT 20
+"""
+
+# Nudge tiers per metric, ordered warning then critical to line up with
+# the (warning, critical) threshold pairs built from NudgeThresholds:
+# (status color, nudge type, message template, suggestion, urgency)
+_INTERRUPT_TIERS = (
+    (
+        "amber",
+        NudgeType.INTERRUPT_FREQUENCY,
+        "You've checked communication apps {count} times",
+        "Consider batching your checks",
+        "gentle",
+    ),
+    (
+        "red",
+        NudgeType.INTERRUPT_FREQUENCY,
+        "High interrupt rate: {count} in 30 min",
+        "Consider enabling Do Not Disturb mode",
+        "important",
+    ),
+)
+_CONTEXT_SWITCH_TIERS = (
+    (
+        "amber",
+        NudgeType.CONTEXT_SWITCH,
+        "Frequent context switching detected",
+        "Focus on one task at a time",
+        "gentle",
+    ),
+    (
+        "red",
+        NudgeType.CONTEXT_SWITCH,
+        "High context switching: {count} switches/hour",
+        "Try working in focused 45-minute blocks",
+        "important",
+    ),
+)
+_DISTRACTION_TIERS = (
+    (
+        "amber",
+        NudgeType.DISTRACTION_ALERT,
+        "30+ minutes on {app_name}",
+        "Time to get back to work?",
+        "gentle",
+    ),
+    (
+        "red",
+        NudgeType.DISTRACTION_ALERT,
+        "Over 1 hour on distractions today",
+        "Consider taking a break or refocusing",
+        "important",
+    ),
+)
+
+
+def replace_file(path: Path, data: bytes) -> None:
+    """Atomically replace path with data.
+
+    Writes a sibling .tmp file and renames it over path, so readers see
+    either the old or the new contents, never a truncated file. The parent
+    directory is only created when the first write attempt finds it missing.
+
+    Args:
+        path: File to replace
+        data: New contents
+    """
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        try:
+            tmp_path.write_bytes(data)
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+class StatusFileWriter:
+    """Writes a JSON status file, and only when its contents changed.
+
+    Owners call mark_dirty() on every mutation; write() then serializes the
+    status once, caches the bytes until the next mutation, and replaces the
+    file atomically from a worker thread. A failed write leaves the status
+    dirty so the next attempt retries it.
+    """
+
+    def __init__(self, path: Path, build: Callable[[], dict[str, Any]]):
+        """Initialize the writer.
+
+        Args:
+            path: Status file to maintain
+            build: Returns the current status as a JSON-serializable dict
+        """
+        self.path = path
+        self._build = build
+        self.dirty = True
+        # Set on every mutation; the owner's writer task sleeps on it
+        self.event = asyncio.Event()
+        self.event.set()
+        # Serialized status, kept until the next mutation
+        self._payload: bytes | None = None
+        # File writes run in a worker thread; keep them in order
+        self._lock = asyncio.Lock()
+
+    def mark_dirty(self) -> None:
+        """Flag the file as stale and wake the writer."""
+        self.dirty = True
+        self._payload = None
+        self.event.set()
+
+    async def write(self) -> None:
+        """Replace the status file if the status changed since the last write."""
+        if not self.dirty:
+            return
+
+        try:
+            if self._payload is None:
+                self._payload = json.dumps(self._build(), separators=(",", ":")).encode()
+
+            # Cleared before the write so mutations made meanwhile re-dirty it
+            payload = self._payload
+            self.dirty = False
+            async with self._lock:
+                await asyncio.to_thread(replace_file, self.path, payload)
+
+            logger.debug("Wrote optimization status to %s", self.path)
+        except Exception as e:
+            self.dirty = True
+            logger.warning("Failed to write optimization status: %s", e)
 
-@dataclass
+
+class Cooldown:
+    """Minimum spacing between nudges, measured on the monotonic clock."""
+
+    __slots__ = ("interval", "_last")
+
+    def __init__(self, interval_seconds: float):
+        """Initialize the cooldown.
+
+        Args:
+            interval_seconds: Seconds that must pass between triggers
+        """
+        self.interval = interval_seconds
+        self._last: float | None = None
+
+    def ready(self) -> bool:
+        """Whether the interval has passed since the last trigger."""
+        return self._last is None or time.monotonic() - self._last >= self.interval
+
+    def trigger(self) -> None:
+        """Start a new cooldown interval now."""
+        self._last = time.monotonic()
+
+
+@dataclass(slots=True)
 class NudgeThresholds:
     """Configurable thresholds for nudge triggers."""
 
@@ -49,7 +234,7 @@ class NudgeThresholds:
     nudge_cooldown_minutes: int = 30
 
 
-@dataclass
+@dataclass(slots=True)
 class NudgeState:
     """Current state of the nudge system."""
 
@@ -65,7 +250,9 @@ class NudgeState:
     # Status
     status_color: str = "green"  # green, amber, red
     last_nudge_time: datetime | None = None
-    pending_nudges: list[Nudge] = field(default_factory=list)
+    pending_nudges: deque[Nudge] = field(
+        default_factory=lambda: deque(maxlen=MAX_PENDING_NUDGES)
+    )
 
     # Daily totals
     daily_interrupts: int = 0
@@ -73,6 +260,65 @@ class NudgeState:
     daily_distraction_minutes: float = 0.0
 
 
+class NudgeQueue:
+    """Buffers nudges and writes them to nudge_history in batches.
+
+    Each flush is one transaction, so a burst of nudges costs a single
+    commit instead of one per row.
+    """
+
+    def __init__(self, db: Any | None = None):
+        """Initialize the queue.
+
+        Args:
+            db: Database instance
+        """
+        self.db = db
+        self._pending: deque[Nudge] = deque()
+        self._flush_task: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def put(self, nudge: Nudge) -> None:
+        """Queue a nudge, flushing if the batch is full.
+
+        Args:
+            nudge: The nudge to save
+        """
+        if not self.db:
+            return
+
+        self._pending.append(nudge)
+        if len(self._pending) >= NUDGE_FLUSH_BATCH_SIZE:
+            await self.flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        """Flush after the batching delay."""
+        await asyncio.sleep(NUDGE_FLUSH_DELAY_SECONDS)
+        self._flush_task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Insert all queued nudges in one transaction."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+        if not self.db or not self._pending:
+            return
+
+        rows = [nudge.to_db_dict() for nudge in self._pending]
+        self._pending.clear()
+
+        try:
+            await self.db.insert_many("nudge_history", rows)
+        except Exception as e:
+            logger.warning("Failed to save %d nudges: %s", len(rows), e)
+
+
 class NudgeSystem:
     """Real-time nudge system for optimization insights."""
 
@@ -95,13 +341,76 @@ class NudgeSystem:
 
         self._state = NudgeState()
         self._running = False
+        # Status file contents, refilled in place for every write
+        self._status_buf: dict[str, Any] = OptimizationStatus().to_dict()
+        self._status_buf["updated_at"] = ""
+        self._status_writer = StatusFileWriter(self.status_file, self._fill_status_buf)
+        self._latest_nudge_buf: dict[str, Any] = {}
         self._status_update_task: asyncio.Task | None = None
+        # False once an owner drives write_status() from its own tick
+        self._owns_writer = True
+        self._nudge_queue = NudgeQueue(db)
+
+        # (warning, critical) pairs searched against the *_TIERS tables
+        t = self.thresholds
+        self._interrupt_levels = (
+            t.interrupts_per_30min_warning,
+            t.interrupts_per_30min_critical,
+        )
+        self._switch_levels = (t.switches_per_hour_warning, t.switches_per_hour_critical)
+        self._distraction_levels = (
+            t.distraction_minutes_warning,
+            t.distraction_minutes_critical,
+        )
+
+        # Replaced by the engine's cooldown when attached to one
+        self.cooldown = Cooldown(self.thresholds.nudge_cooldown_minutes * 60)
+
+        # ISO timestamp for status output, refreshed at most once a second
+        self._now_iso_tick = -1
+        self._now_iso_cache = ""
 
     @property
     def status_file(self) -> Path:
         """Path to the optimization status JSON file."""
         return self.data_dir / "optimization_status.json"
 
+    def use_status_writer(self, writer: StatusFileWriter) -> None:
+        """Report status changes through an owner's writer instead of a private one.
+
+        The owner merges status_fields() into its own status, so a single
+        writer maintains optimization_status.json. The owner becomes
+        responsible for writing when the writer's event fires, and start()
+        no longer spawns a writer task.
+
+        Args:
+            writer: The owner's status file writer
+        """
+        if self._status_writer.dirty:
+            writer.mark_dirty()
+        self._status_writer = writer
+        self._owns_writer = False
+
+    def status_fields(self) -> dict[str, Any]:
+        """Status fields owned by this system, for merging into an owner's status.
+
+        Returns:
+            savings_progress and updated_at, plus latest_nudge while a
+            nudge is pending
+        """
+        buf = self._fill_status_buf()
+        owned = {
+            "savings_progress": buf["savings_progress"],
+            "updated_at": buf["updated_at"],
+        }
+        if buf["latest_nudge"] is not None:
+            owned["latest_nudge"] = buf["latest_nudge"]
+        return owned
+
+    def _mark_dirty(self) -> None:
+        """Flag the status file as stale and wake the writer."""
+        self._status_writer.mark_dirty()
+
     async def start(self) -> None:
         """Start the nudge system."""
         if self._running:
@@ -111,9 +420,10 @@ class NudgeSystem:
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
         # Start periodic status file updates
-        self._status_update_task = asyncio.create_task(
-            self._periodic_status_update()
-        )
+        if self._owns_writer:
+            self._status_update_task = asyncio.create_task(
+                self._periodic_status_update()
+            )
 
         # Initial status write
         await self.write_status()
@@ -131,6 +441,8 @@ class NudgeSystem:
             except asyncio.CancelledError:
                 pass
 
+        await self._nudge_queue.flush()
+
         # Final status write
         await self.write_status()
 
@@ -147,26 +459,12 @@ class NudgeSystem:
         """
         self._state.recent_interrupts += count
         self._state.daily_interrupts += count
+        self._mark_dirty()
 
-        # Check thresholds
-        if self._state.recent_interrupts >= self.thresholds.interrupts_per_30min_critical:
-            self._state.status_color = "red"
-            return self._create_nudge(
-                NudgeType.INTERRUPT_FREQUENCY,
-                f"High interrupt rate: {self._state.recent_interrupts} in 30 min",
-                "Consider enabling Do Not Disturb mode",
-                "important",
-            )
-        elif self._state.recent_interrupts >= self.thresholds.interrupts_per_30min_warning:
-            self._state.status_color = "amber"
-            return self._create_nudge(
-                NudgeType.INTERRUPT_FREQUENCY,
-                f"You've checked communication apps {self._state.recent_interrupts} times",
-                "Consider batching your checks",
-                "gentle",
-            )
-
-        return None
+        recent = self._state.recent_interrupts
+        return self._check_tiers(
+            self._interrupt_levels, _INTERRUPT_TIERS, recent, count=recent
+        )
 
     async def on_context_switch(
         self,
@@ -182,26 +480,12 @@ class NudgeSystem:
         """
         self._state.recent_switches += 1
         self._state.daily_context_switches += 1
+        self._mark_dirty()
 
-        # Check thresholds
-        if self._state.recent_switches >= self.thresholds.switches_per_hour_critical:
-            self._state.status_color = "red"
-            return self._create_nudge(
-                NudgeType.CONTEXT_SWITCH_FREQUENCY,
-                f"High context switching: {self._state.recent_switches} switches/hour",
-                "Try working in focused 45-minute blocks",
-                "important",
-            )
-        elif self._state.recent_switches >= self.thresholds.switches_per_hour_warning:
-            self._state.status_color = "amber"
-            return self._create_nudge(
-                NudgeType.CONTEXT_SWITCH_FREQUENCY,
-                f"Frequent context switching detected",
-                "Focus on one task at a time",
-                "gentle",
-            )
-
-        return None
+        recent = self._state.recent_switches
+        return self._check_tiers(
+            self._switch_levels, _CONTEXT_SWITCH_TIERS, recent, count=recent
+        )
 
     async def on_distraction(
         self,
@@ -219,26 +503,14 @@ class NudgeSystem:
         """
         self._state.recent_distraction_minutes += duration_minutes
         self._state.daily_distraction_minutes += duration_minutes
+        self._mark_dirty()
 
-        # Check thresholds
-        if self._state.recent_distraction_minutes >= self.thresholds.distraction_minutes_critical:
-            self._state.status_color = "red"
-            return self._create_nudge(
-                NudgeType.DISTRACTION_ALERT,
-                f"Over 1 hour on distractions today",
-                "Consider taking a break or refocusing",
-                "important",
-            )
-        elif self._state.recent_distraction_minutes >= self.thresholds.distraction_minutes_warning:
-            self._state.status_color = "amber"
-            return self._create_nudge(
-                NudgeType.DISTRACTION_ALERT,
-                f"30+ minutes on {app_name}",
-                "Time to get back to work?",
-                "gentle",
-            )
-
-        return None
+        return self._check_tiers(
+            self._distraction_levels,
+            _DISTRACTION_TIERS,
+            self._state.recent_distraction_minutes,
+            app_name=app_name,
+        )
 
     async def on_deep_work_achieved(
         self,
@@ -252,31 +524,54 @@ class NudgeSystem:
         Returns:
             Nudge (positive) if milestone reached
         """
-        self._state.current_deep_work_minutes = duration_minutes
-        self._state.daily_deep_work_minutes = max(
-            self._state.daily_deep_work_minutes,
-            duration_minutes
-        )
+        state = self._state
+        state.current_deep_work_minutes = duration_minutes
+        if duration_minutes > state.daily_deep_work_minutes:
+            state.daily_deep_work_minutes = duration_minutes
+        self._mark_dirty()
 
         # Positive nudge for deep work milestone
-        if duration_minutes >= 25 and duration_minutes < 30:  # Just hit 25 min
-            self._state.status_color = "green"
-            return self._create_nudge(
-                NudgeType.DEEP_WORK_MILESTONE,
-                "25-minute focus block achieved!",
-                "Keep going or take a 5-minute break",
-                "positive",
-            )
-        elif duration_minutes >= 45 and duration_minutes < 50:  # Flow state
-            self._state.status_color = "green"
-            return self._create_nudge(
-                NudgeType.DEEP_WORK_MILESTONE,
-                "You're in flow state! 45 minutes of focus",
-                "Excellent deep work - you're crushing it",
-                "positive",
-            )
+        if 25 <= duration_minutes < 30:  # Just hit 25 min
+            message = "25-minute focus block achieved!"
+            suggestion = "Keep going or take a 5-minute break"
+        elif 45 <= duration_minutes < 50:  # Flow state
+            message = "You're in flow state! 45 minutes of focus"
+            suggestion = "Excellent deep work - you're crushing it"
+        else:
+            return None
+
+        state.status_color = "green"
+        return self._create_nudge(
+            NudgeType.DEEP_WORK_MILESTONE, message, suggestion, "positive"
+        )
 
-        return None
+    def _check_tiers(
+        self,
+        levels: tuple[float, float],
+        tiers: tuple[tuple[str, NudgeType, str, str, str], ...],
+        value: float,
+        **message_args: Any,
+    ) -> Nudge | None:
+        """Apply the highest tier whose threshold value has reached.
+
+        Args:
+            levels: Ascending (warning, critical) thresholds
+            tiers: Tier table aligned with levels
+            value: Current metric value
+            **message_args: Values for the tier's message template
+
+        Returns:
+            Nudge for the reached tier, None if below warning or in cooldown
+        """
+        tier = bisect_right(levels, value) - 1
+        if tier < 0:
+            return None
+
+        color, nudge_type, message, suggestion, urgency = tiers[tier]
+        self._state.status_color = color
+        return self._create_nudge(
+            nudge_type, message.format(**message_args), suggestion, urgency
+        )
 
     def _create_nudge(
         self,
@@ -296,12 +591,8 @@ class NudgeSystem:
         Returns:
             Nudge if created, None if in cooldown
         """
-        # Check cooldown
-        if self._state.last_nudge_time:
-            elapsed = (datetime.utcnow() - self._state.last_nudge_time).total_seconds()
-            cooldown_seconds = self.thresholds.nudge_cooldown_minutes * 60
-            if elapsed < cooldown_seconds:
-                return None
+        if not self.cooldown.ready():
+            return None
 
         nudge = Nudge(
             nudge_type=nudge_type,
@@ -310,8 +601,10 @@ class NudgeSystem:
             urgency=urgency,
         )
 
-        self._state.last_nudge_time = datetime.utcnow()
+        self.cooldown.trigger()
+        self._state.last_nudge_time = nudge.timestamp
         self._state.pending_nudges.append(nudge)
+        self._mark_dirty()
 
         return nudge
 
@@ -333,6 +626,16 @@ class NudgeSystem:
             logger.warning(f"Failed to save nudge: {e}")
             return 0
 
+    async def queue_nudge(self, nudge: Nudge) -> None:
+        """Queue a nudge for a batched insert into the database.
+
+        Use this instead of save_nudge when the row ID is not needed.
+
+        Args:
+            nudge: The nudge to save
+        """
+        await self._nudge_queue.put(nudge)
+
     async def acknowledge_nudge(self, nudge_id: int) -> None:
         """Mark a nudge as acknowledged.
 
@@ -343,8 +646,8 @@ class NudgeSystem:
             return
 
         await self.db.execute(
-            "UPDATE nudge_history SET acknowledged_at = ? WHERE id = ?",
-            (datetime.utcnow().isoformat(), nudge_id),
+            _ACKNOWLEDGE_NUDGE_SQL,
+            (time.time_ns() // 1_000_000, nudge_id),
         )
 
     async def dismiss_nudge(self, nudge_id: int) -> None:
@@ -357,10 +660,18 @@ class NudgeSystem:
             return
 
         await self.db.execute(
-            "UPDATE nudge_history SET dismissed_at = ? WHERE id = ?",
-            (datetime.utcnow().isoformat(), nudge_id),
+            _DISMISS_NUDGE_SQL,
+            (time.time_ns() // 1_000_000, nudge_id),
         )
 
+    def _now_iso(self) -> str:
+        """Current UTC time in ISO format, cached for up to a second."""
+        tick = int(time.monotonic())
+        if tick != self._now_iso_tick:
+            self._now_iso_tick = tick
+            self._now_iso_cache = datetime.utcnow().isoformat()
+        return self._now_iso_cache
+
     def get_current_status(self) -> OptimizationStatus:
         """Get the current optimization status.
 
@@ -373,17 +684,52 @@ class NudgeSystem:
             latest_nudge = {
                 "type": nudge.nudge_type.value,
                 "message": nudge.message,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": self._now_iso(),
             }
 
         return OptimizationStatus(
             status_color=self._state.status_color,
             daily_deep_work_hours=self._state.daily_deep_work_minutes / 60.0,
             interrupt_count_today=self._state.daily_interrupts,
-            context_switch_cost_minutes=self._state.daily_context_switches * 2.0,  # Est. 2 min per switch
+            context_switch_cost_minutes=(
+                self._state.daily_context_switches * SWITCH_COST_ESTIMATE_MINUTES
+            ),
             latest_nudge=latest_nudge,
         )
 
+    def _fill_status_buf(self) -> dict[str, Any]:
+        """Refresh the reusable status file dict from the current state.
+
+        Mirrors get_current_status() plus the file-only fields, without
+        allocating a new OptimizationStatus and dicts on every write.
+
+        Returns:
+            The shared status dict
+        """
+        state = self._state
+        buf = self._status_buf
+
+        latest_nudge = None
+        if state.pending_nudges:
+            nudge = state.pending_nudges[-1]
+            latest_nudge = self._latest_nudge_buf
+            latest_nudge["type"] = nudge.nudge_type.value
+            latest_nudge["message"] = nudge.message
+            latest_nudge["timestamp"] = self._now_iso()
+
+        buf["status_color"] = state.status_color
+        buf["daily_deep_work_hours"] = state.daily_deep_work_minutes / 60.0
+        buf["interrupt_count_today"] = state.daily_interrupts
+        buf["context_switch_cost_minutes"] = (
+            state.daily_context_switches * SWITCH_COST_ESTIMATE_MINUTES
+        )
+        buf["latest_nudge"] = latest_nudge
+        buf["savings_progress"]["actual_percent"] = max(
+            0, 20 - (state.daily_distraction_minutes / 480 * 20)
+        )
+        buf["updated_at"] = self._now_iso()
+        return buf
+
     async def write_status(self) -> None:
         """Write current status to optimization_status.json.
 
@@ -391,43 +737,30 @@ class NudgeSystem:
         - Menu bar apps for status color
         - Dashboard widgets
         - CLI tools
-        """
-        try:
-            self.data_dir.mkdir(parents=True, exist_ok=True)
-
-            status = self.get_current_status()
-            status_dict = status.to_dict()
-
-            # Add additional context
-            status_dict["updated_at"] = datetime.utcnow().isoformat()
-            status_dict["savings_progress"] = {
-                "goal_percent": 20,
-                "actual_percent": max(0, 20 - (self._state.daily_distraction_minutes / 480 * 20)),
-            }
-
-            with open(self.status_file, "w") as f:
-                json.dump(status_dict, f, indent=2)
-
-            logger.debug(f"Wrote optimization status to {self.status_file}")
 
-        except Exception as e:
-            logger.warning(f"Failed to write optimization status: {e}")
+        Nothing is written while the status is unchanged; see
+        StatusFileWriter.
+        """
+        await self._status_writer.write()
 
     async def _periodic_status_update(self) -> None:
-        """Periodically update the status file and reset rolling windows."""
+        """Rewrite the status file whenever state changes.
+
+        Sleeps until a mutation sets the dirty event, then writes once and
+        waits out MIN_STATUS_WRITE_INTERVAL_SECONDS so a burst of events
+        becomes a single write.
+        """
         while self._running:
             try:
-                # Write current status
+                await self._status_writer.event.wait()
+                self._status_writer.event.clear()
                 await self.write_status()
-
-                # Every 30 minutes, reset rolling window counters
-                # (This is a simplified approach - could use actual time windows)
-                await asyncio.sleep(30)  # Check every 30 seconds
+                await asyncio.sleep(MIN_STATUS_WRITE_INTERVAL_SECONDS)
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.warning(f"Error in periodic status update: {e}")
+                logger.warning("Error in periodic status update: %s", e)
                 await asyncio.sleep(60)
 
     async def reset_rolling_window(self) -> None:
@@ -435,6 +768,7 @@ class NudgeSystem:
         self._state.recent_interrupts = 0
         self._state.recent_switches = 0
         self._state.recent_distraction_minutes = 0.0
+        self._mark_dirty()
 
         # Update status color based on current state
         await self._recalculate_status_color()
@@ -454,14 +788,17 @@ class NudgeSystem:
         if self._state.daily_distraction_minutes > 60:
             self._state.status_color = "red"
 
+        self._mark_dirty()
+
     async def reset_daily(self) -> None:
         """Reset daily counters (called at midnight or new day)."""
         self._state.daily_interrupts = 0
         self._state.daily_context_switches = 0
         self._state.daily_distraction_minutes = 0.0
         self._state.daily_deep_work_minutes = 0.0
-        self._state.pending_nudges = []
+        self._state.pending_nudges.clear()
         self._state.status_color = "green"
+        self._mark_dirty()
 
         await self.write_status()
         logger.info("Daily nudge counters reset")
@@ -483,14 +820,6 @@ class NudgeSystem:
 
         cutoff = datetime.utcnow() - timedelta(hours=hours)
 
-        rows = await self.db.fetch_all(
-            """
-            SELECT * FROM nudge_history
-            WHERE timestamp > ?
-            ORDER BY timestamp DESC
-            LIMIT 20
-            """,
-            (cutoff.isoformat(),),
-        )
+        rows = await self.db.fetch_all(_RECENT_NUDGES_SQL, (cutoff.isoformat(),))
 
         return [dict(row) for row in rows]
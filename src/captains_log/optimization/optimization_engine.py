@@ -11,16 +11,19 @@ This module coordinates all optimization components:
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from captains_log.core.config import OptimizationConfig
-from captains_log.optimization.interrupt_detector import (
-    ActivityEvent,
-    InterruptDetector,
+from captains_log.optimization.interrupt_detector import InterruptDetector
+from captains_log.optimization.nudge_system import (
+    Cooldown,
+    NudgeQueue,
+    NudgeSystem,
+    StatusFileWriter,
 )
 from captains_log.optimization.context_switch_analyzer import ContextSwitchAnalyzer
 from captains_log.optimization.schemas import (
@@ -35,11 +38,16 @@ logger = logging.getLogger(__name__)
 class OptimizationEngine:
     """Main coordinator for time optimization features."""
 
+    # Daily interrupt counts above which the status color is forced
+    AMBER_INTERRUPT_THRESHOLD = 15
+    RED_INTERRUPT_THRESHOLD = 30
+
     def __init__(
         self,
         db: Any,
         config: OptimizationConfig,
         data_dir: Path | None = None,
+        nudge_system: NudgeSystem | None = None,
     ):
         """Initialize the optimization engine.
 
@@ -47,33 +55,57 @@ class OptimizationEngine:
             db: Database instance
             config: Optimization configuration
             data_dir: Data directory for status files
+            nudge_system: Nudge system whose status file this engine's
+                writer task should also keep up to date
         """
         self.db = db
         self.config = config
         self.data_dir = data_dir or Path.home() / "Library/Application Support/CaptainsLog"
+        self.status_file = self.data_dir / "optimization_status.json"
 
         # Initialize analyzers
         self.interrupt_detector = InterruptDetector(db=db)
         self.context_switch_analyzer = ContextSwitchAnalyzer(db=db)
+        self._nudge_queue = NudgeQueue(db)
 
         # State tracking
         self._running = False
-        self._last_nudge_time: datetime | None = None
+        self._current_app: str | None = None
+        self.nudge_cooldown = Cooldown(config.nudge_cooldown_minutes * 60)
         self._status = OptimizationStatus()
+        # Minute of the last status color evaluation
+        self._color_tick = -1
+        # Whole deep work minutes last written to the status
+        self._deep_work_minute = 0
+        # Rewrites the status file after _status changes
+        self._status_writer = StatusFileWriter(self.status_file, self._status_payload)
+
+        # An attached nudge system reports through this engine's status file
+        # and writer, and one cooldown spaces out nudges from either source
+        self.nudge_system = nudge_system
+        if nudge_system is not None:
+            nudge_system.use_status_writer(self._status_writer)
+            nudge_system.cooldown = self.nudge_cooldown
 
         # Background task for periodic updates
         self._update_task: asyncio.Task | None = None
 
+    def _mark_dirty(self) -> None:
+        """Flag the status file as stale and wake the writer."""
+        self._status_writer.mark_dirty()
+
     async def start(self) -> None:
         """Start the optimization engine."""
         if self._running:
             return
 
         self._running = True
+        if self.nudge_system:
+            await self.nudge_system.start()
         logger.info("Optimization engine started")
 
         # Start periodic status updates
-        if self.config.write_status_file:
+        if self.config.write_status_file or self.nudge_system:
             self._update_task = asyncio.create_task(self._periodic_status_update())
 
     async def stop(self) -> None:
@@ -87,6 +119,11 @@ class OptimizationEngine:
             except asyncio.CancelledError:
                 pass
 
+        await self._nudge_queue.flush()
+
+        if self.nudge_system:
+            await self.nudge_system.stop()
+
         # Write final status
         await self._write_status_file()
 
@@ -114,50 +151,57 @@ class OptimizationEngine:
         if not self.config.enabled:
             return
 
-        # Create activity event
-        event = ActivityEvent(
-            timestamp=timestamp,
-            app_name=app_name,
-            bundle_id=bundle_id,
-            window_title=window_title,
-            work_category=work_category,
-        )
-
-        # Process through interrupt detector
-        interrupt = self.interrupt_detector.on_activity(event)
-        if interrupt:
-            await self.interrupt_detector.save_interrupt(interrupt)
-            self._status.interrupt_count_today += 1
+        recolor = False
 
-            # Check for nudge
-            if self.config.enable_nudges:
-                await self._check_interrupt_nudge()
+        # Both analyzers ignore repeats of the current app, so only an
+        # actual app change is fed through them
+        if app_name != self._current_app:
+            self._current_app = app_name
 
-        # Process through context switch analyzer
-        switch = self.context_switch_analyzer.on_app_change(
-            timestamp=timestamp,
-            new_app=app_name,
-        )
-        if switch:
-            await self.context_switch_analyzer.save_switch(switch)
-            self._status.context_switch_cost_minutes += switch.estimated_cost_minutes
-
-        # Update deep work tracking
-        if self.context_switch_analyzer.is_in_deep_work():
-            duration = self.context_switch_analyzer.get_current_focus_duration()
-            self._status.daily_deep_work_hours = duration / 60.0
-
-        # Update status color based on current state
-        self._update_status_color()
+            # Process through interrupt detector
+            interrupt = self.interrupt_detector.on_activity_raw(
+                timestamp, app_name, bundle_id, window_title, work_category
+            )
+            if interrupt:
+                await self.interrupt_detector.save_interrupt(interrupt)
+                self._status.interrupt_count_today += 1
+                self._mark_dirty()
+                recolor = True
+
+                # Check for nudge
+                if self.config.enable_nudges:
+                    await self._check_interrupt_nudge()
+
+            # Process through context switch analyzer
+            switch = self.context_switch_analyzer.on_app_change(
+                timestamp=timestamp,
+                new_app=app_name,
+            )
+            if switch:
+                await self.context_switch_analyzer.save_switch(switch)
+                self._status.context_switch_cost_minutes += switch.estimated_cost_minutes
+                self._mark_dirty()
+
+        # Update deep work tracking, once per whole minute of progress
+        deep_work_minutes = self.context_switch_analyzer.get_deep_work_duration()
+        if deep_work_minutes and int(deep_work_minutes) != self._deep_work_minute:
+            self._deep_work_minute = int(deep_work_minutes)
+            self._status.daily_deep_work_hours = deep_work_minutes / 60.0
+            self._mark_dirty()
+            recolor = True
+
+        # The color depends only on interrupts, deep work and the time of
+        # day, so re-evaluate it when one of those moved (time once a minute)
+        tick = int(time.monotonic() // 60)
+        if recolor or tick != self._color_tick:
+            self._color_tick = tick
+            self._update_status_color()
 
     async def _check_interrupt_nudge(self) -> None:
         """Check if we should nudge about interrupt frequency."""
         # Respect cooldown
-        if self._last_nudge_time:
-            elapsed = (datetime.utcnow() - self._last_nudge_time).total_seconds()
-            cooldown_seconds = self.config.nudge_cooldown_minutes * 60
-            if elapsed < cooldown_seconds:
-                return
+        if not self.nudge_cooldown.ready():
+            return
 
         # Check interrupt frequency
         should_nudge, message = await self.interrupt_detector.should_nudge_interrupt_frequency(
@@ -172,17 +216,18 @@ class OptimizationEngine:
                 urgency="gentle",
             )
 
-            # Save nudge
-            await self.db.insert("nudge_history", nudge.to_db_dict())
+            # Save nudge (batched with any others in the flush window)
+            await self._nudge_queue.put(nudge)
 
             # Update status with latest nudge
             self._status.latest_nudge = {
                 "type": nudge.nudge_type.value,
                 "message": nudge.message,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": nudge.timestamp.isoformat(),
             }
 
-            self._last_nudge_time = datetime.utcnow()
+            self.nudge_cooldown.trigger()
+            self._mark_dirty()
             logger.info(f"Nudge generated: {message}")
 
     def _update_status_color(self) -> None:
@@ -191,6 +236,7 @@ class OptimizationEngine:
         # Amber: Slightly off track or high interrupts
         # Red: Significant issues
 
+        previous_color = self._status.status_color
         deep_work_hours = self._status.daily_deep_work_hours
         ideal_hours = self.config.ideal_deep_work_hours
 
@@ -212,39 +258,52 @@ class OptimizationEngine:
             self._status.status_color = "red"
 
         # Override to amber/red for high interrupt count
-        if self._status.interrupt_count_today > 30:
+        if self._status.interrupt_count_today > self.RED_INTERRUPT_THRESHOLD:
             self._status.status_color = "red"
-        elif self._status.interrupt_count_today > 15:
+        elif self._status.interrupt_count_today > self.AMBER_INTERRUPT_THRESHOLD:
             if self._status.status_color == "green":
                 self._status.status_color = "amber"
 
-    async def _write_status_file(self) -> None:
-        """Write optimization status to JSON file for menu bar integration."""
-        if not self.config.write_status_file:
-            return
+        if self._status.status_color != previous_color:
+            self._mark_dirty()
 
-        status_file = self.data_dir / "optimization_status.json"
+    def _status_payload(self) -> dict[str, Any]:
+        """Build the status file contents.
 
-        try:
-            self.data_dir.mkdir(parents=True, exist_ok=True)
+        Fields owned by an attached nudge system are merged in, so the file
+        keeps one schema whichever side changed.
+        """
+        status = self._status.to_dict()
+        if self.nudge_system:
+            status.update(self.nudge_system.status_fields())
+        return status
 
-            with open(status_file, "w") as f:
-                json.dump(self._status.to_dict(), f, indent=2)
+    async def _write_status_file(self) -> None:
+        """Write optimization status to JSON file for menu bar integration.
 
-            logger.debug(f"Wrote optimization status to {status_file}")
-        except Exception as e:
-            logger.warning(f"Failed to write optimization status: {e}")
+        Nothing is written while the status is unchanged; see
+        StatusFileWriter.
+        """
+        if self.config.write_status_file or self.nudge_system:
+            await self._status_writer.write()
 
     async def _periodic_status_update(self) -> None:
-        """Periodically update the status file."""
+        """Rewrite the status file whenever the status changes.
+
+        Writes are spaced at least status_write_interval_seconds apart so a
+        burst of activity events becomes a single write. Changes in an
+        attached nudge system wake this task too.
+        """
         while self._running:
             try:
+                await self._status_writer.event.wait()
+                self._status_writer.event.clear()
                 await self._write_status_file()
-                await asyncio.sleep(5)  # Update every 5 seconds
+                await asyncio.sleep(self.config.status_write_interval_seconds)
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.warning(f"Error in periodic status update: {e}")
+                logger.warning("Error in periodic status update: %s", e)
                 await asyncio.sleep(30)  # Back off on error
 
     async def get_daily_summary(self, target_date: datetime | None = None) -> dict[str, Any]:
@@ -258,11 +317,11 @@ class OptimizationEngine:
         """
         target_date = target_date or datetime.utcnow()
 
-        # Get interrupt metrics
-        interrupt_metrics = await self.interrupt_detector.get_daily_metrics(target_date)
-
-        # Get context switch metrics
-        switch_metrics = await self.context_switch_analyzer.get_daily_metrics(target_date)
+        # Interrupt and context switch metrics are independent queries
+        interrupt_metrics, switch_metrics = await asyncio.gather(
+            self.interrupt_detector.get_daily_metrics(target_date),
+            self.context_switch_analyzer.get_daily_metrics(target_date),
+        )
 
         return {
             "date": target_date.strftime("%Y-%m-%d"),
@@ -275,4 +334,7 @@ class OptimizationEngine:
     async def reset_daily_metrics(self) -> None:
         """Reset daily metrics (called at midnight or new day)."""
         self._status = OptimizationStatus()
+        self._color_tick = -1
+        self._deep_work_minute = 0
+        self._mark_dirty()
         logger.info("Daily optimization metrics reset")
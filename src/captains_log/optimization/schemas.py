@@ -2,13 +2,36 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import sys
+from bisect import bisect_right
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field, fields
 from datetime import date, datetime
-from enum import Enum
+from datetime import date as date_type
+from enum import StrEnum
+from functools import lru_cache, partial
+from operator import attrgetter
+from types import MappingProxyType
 from typing import Any
 
+# JSON helpers backed by orjson when it is installed, stdlib json otherwise
+_json_loads: Callable[[str | bytes], Any]
 
-class DEALCategory(str, Enum):
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+
+class DEALCategory(StrEnum):
     """DEAL framework categories for activity classification."""
 
     DELEGATE = "delegate"  # Tasks someone else could do
@@ -17,7 +40,7 @@ class DEALCategory(str, Enum):
     LEVERAGE = "leverage"  # High-value work to double down on
 
 
-class InterruptType(str, Enum):
+class InterruptType(StrEnum):
     """Types of interrupts based on duration."""
 
     QUICK_CHECK = "quick_check"  # < 30 seconds
@@ -26,7 +49,13 @@ class InterruptType(str, Enum):
     DEEP_COMMUNICATION = "deep_communication"  # > 15 min
 
 
-class NudgeType(str, Enum):
+# Upper duration bounds (seconds) for each InterruptType, in enum order.
+# Durations past the last bound are DEEP_COMMUNICATION.
+INTERRUPT_DURATION_THRESHOLDS = (30.0, 120.0, 900.0)
+_INTERRUPT_TYPES = tuple(InterruptType)
+
+
+class NudgeType(StrEnum):
     """Types of nudges for behavior change."""
 
     INTERRUPT_FREQUENCY = "interrupt_frequency"
@@ -34,11 +63,12 @@ class NudgeType(str, Enum):
     MEETING_FRAGMENTATION = "meeting_fragmentation"
     DISTRACTION_ALERT = "distraction_alert"
     DEEP_WORK_OPPORTUNITY = "deep_work_opportunity"
+    DEEP_WORK_MILESTONE = "deep_work_milestone"
     BREAK_SUGGESTION = "break_suggestion"
     GOAL_PROGRESS = "goal_progress"
 
 
-class SwitchType(str, Enum):
+class SwitchType(StrEnum):
     """Types of context switches."""
 
     VOLUNTARY = "voluntary"  # User-initiated switch
@@ -47,7 +77,17 @@ class SwitchType(str, Enum):
     BREAK = "break"  # Break time
 
 
-@dataclass
+def _insert_sql(table: str, columns: tuple[str, ...]) -> str:
+    """Build a positional INSERT statement for the given columns."""
+    placeholders = ", ".join("?" * len(columns))
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+
+
+# Shared by every UserProfile until it is given its own list
+DEFAULT_COMMUNICATION_APPS = ("Slack", "Discord", "Mail", "Messages", "Teams", "Zoom")
+
+
+@dataclass(slots=True)
 class UserProfile:
     """User profile for personalized optimization."""
 
@@ -61,16 +101,13 @@ class UserProfile:
     preferred_work_start: str = "09:00"
     preferred_work_end: str = "18:00"
     focus_apps: list[str] = field(default_factory=list)  # Apps for deep work
-    communication_apps: list[str] = field(default_factory=lambda: [
-        "Slack", "Discord", "Mail", "Messages", "Teams", "Zoom"
-    ])
+    communication_apps: tuple[str, ...] | list[str] = DEFAULT_COMMUNICATION_APPS
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
     @classmethod
     def from_db_row(cls, row: dict[str, Any]) -> UserProfile:
         """Create from database row."""
-        import json
         return cls(
             id=row.get("id"),
             role=row.get("role", ""),
@@ -81,14 +118,14 @@ class UserProfile:
             ideal_deep_work_hours=row.get("ideal_deep_work_hours", 4.0),
             preferred_work_start=row.get("preferred_work_start", "09:00"),
             preferred_work_end=row.get("preferred_work_end", "18:00"),
-            focus_apps=json.loads(row.get("focus_apps", "[]") or "[]"),
-            communication_apps=json.loads(row.get("communication_apps", "[]") or "[]"),
+            focus_apps=_json_loads(row.get("focus_apps", "[]") or "[]"),
+            communication_apps=_json_loads(row.get("communication_apps", "[]") or "[]"),
             created_at=row.get("created_at"),
             updated_at=row.get("updated_at"),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class InterruptEvent:
     """Represents an interrupt (communication check)."""
 
@@ -101,34 +138,83 @@ class InterruptEvent:
     interrupt_type: InterruptType = InterruptType.QUICK_CHECK
     context_loss_estimate: float = 0.0  # Estimated minutes lost
     work_context_before: str = ""  # e.g., "coding", "writing"
+    _timestamp_iso: tuple[datetime, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # Column order of to_db_tuple(), matching INSERT_SQL
+    DB_COLUMNS = (
+        "timestamp",
+        "interrupt_app",
+        "duration_seconds",
+        "previous_app",
+        "next_app",
+        "interrupt_type",
+        "context_loss_estimate",
+        "work_context_before",
+    )
+    INSERT_SQL = _insert_sql("interrupts", DB_COLUMNS)
+
+    def __post_init__(self) -> None:
+        # App names repeat across thousands of events; intern them so
+        # aggregation compares and hashes them by identity.
+        self.interrupt_app = sys.intern(self.interrupt_app)
+        self.previous_app = sys.intern(self.previous_app)
+        self.next_app = sys.intern(self.next_app)
+        self.work_context_before = sys.intern(self.work_context_before)
 
     @classmethod
     def classify_interrupt(cls, duration_seconds: float) -> InterruptType:
         """Classify interrupt type based on duration."""
-        if duration_seconds < 30:
-            return InterruptType.QUICK_CHECK
-        elif duration_seconds < 120:  # 2 min
-            return InterruptType.SHORT_RESPONSE
-        elif duration_seconds < 900:  # 15 min
-            return InterruptType.ACTIVE_COMMUNICATION
-        else:
-            return InterruptType.DEEP_COMMUNICATION
+        return _INTERRUPT_TYPES[
+            bisect_right(INTERRUPT_DURATION_THRESHOLDS, duration_seconds)
+        ]
+
+    @classmethod
+    def bulk_classify_interrupts(
+        cls, durations_seconds: Iterable[float]
+    ) -> list[InterruptType]:
+        """Classify many interrupt durations at once.
+
+        Chains map() over the bisect lookup so the loop stays in C rather
+        than making one classify_interrupt call per duration.
+        """
+        ordinals = map(partial(bisect_right, INTERRUPT_DURATION_THRESHOLDS), durations_seconds)
+        return list(map(_INTERRUPT_TYPES.__getitem__, ordinals))
+
+    def timestamp_iso(self) -> str | None:
+        """Return the timestamp in ISO format, formatted once per timestamp."""
+        timestamp = self.timestamp
+        if not timestamp:
+            return None
+        cached = self._timestamp_iso
+        if cached is None or cached[0] is not timestamp:
+            cached = self._timestamp_iso = (timestamp, timestamp.isoformat())
+        return cached[1]
+
+    def to_db_tuple(self) -> tuple[Any, ...]:
+        """Convert to a row in DB_COLUMNS order, for INSERT_SQL.
+
+        The timestamp is stored as ``YYYY-MM-DDTHH:MM:SS[.ffffff]``; the
+        interrupt detector relies on the hour sitting at characters 11-13.
+        """
+        return (
+            self.timestamp_iso(),
+            self.interrupt_app,
+            self.duration_seconds,
+            self.previous_app,
+            self.next_app,
+            self.interrupt_type,
+            self.context_loss_estimate,
+            self.work_context_before,
+        )
 
     def to_db_dict(self) -> dict[str, Any]:
         """Convert to database dictionary."""
-        return {
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
-            "interrupt_app": self.interrupt_app,
-            "duration_seconds": self.duration_seconds,
-            "previous_app": self.previous_app,
-            "next_app": self.next_app,
-            "interrupt_type": self.interrupt_type.value,
-            "context_loss_estimate": self.context_loss_estimate,
-            "work_context_before": self.work_context_before,
-        }
+        return dict(zip(self.DB_COLUMNS, self.to_db_tuple()))
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextSwitch:
     """Represents a context switch between apps/tasks."""
 
@@ -142,9 +228,27 @@ class ContextSwitch:
     estimated_cost_minutes: float = 0.0
     actual_recovery_seconds: float | None = None  # Measured recovery time
     switch_type: SwitchType = SwitchType.VOLUNTARY
-
-    # Cost multipliers based on context affinity
-    AFFINITY_COSTS = {
+    _timestamp_iso: tuple[datetime, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # Column order of to_db_tuple(), matching INSERT_SQL
+    DB_COLUMNS = (
+        "timestamp",
+        "from_app",
+        "from_category",
+        "to_app",
+        "to_category",
+        "deep_work_duration_before",
+        "estimated_cost_minutes",
+        "actual_recovery_seconds",
+        "switch_type",
+    )
+    INSERT_SQL = _insert_sql("context_switches", DB_COLUMNS)
+
+    # Cost multipliers based on context affinity. Read-only: calculate_cost
+    # uses a table built from these at import time.
+    AFFINITY_COSTS = MappingProxyType({
         ("coding", "coding"): 0.5,
         ("writing", "writing"): 0.5,
         ("coding", "docs"): 1.0,
@@ -152,14 +256,25 @@ class ContextSwitch:
         ("coding", "entertainment"): 3.0,
         ("deep_work", "communication"): 2.5,
         ("deep_work", "entertainment"): 4.0,
-    }
+    })
 
     # Depth multipliers based on time in previous context
-    DEPTH_MULTIPLIERS = {
+    DEPTH_MULTIPLIERS = MappingProxyType({
         "shallow": 1.0,  # < 5 min
         "building": 2.0,  # 5-25 min
         "deep": 3.0,  # > 25 min
-    }
+    })
+
+    def __post_init__(self) -> None:
+        # Categories key AFFINITY_COSTS lookups and app names repeat across
+        # thousands of switches; intern them so they hash and compare cheaply.
+        self.from_app = sys.intern(self.from_app)
+        self.from_category = sys.intern(self.from_category)
+        self.to_app = sys.intern(self.to_app)
+        self.to_category = sys.intern(self.to_category)
+        # Serialization binds switch_type unguarded, so never let it be None
+        if self.switch_type is None:
+            self.switch_type = SwitchType.VOLUNTARY
 
     @classmethod
     def calculate_cost(
@@ -169,36 +284,90 @@ class ContextSwitch:
         deep_work_duration_before: float,
     ) -> float:
         """Calculate estimated cost of a context switch in minutes."""
-        # Get base cost from affinity matrix
-        key = (from_category, to_category)
-        base_cost = cls.AFFINITY_COSTS.get(key, 1.5)  # Default 1.5 min
-
-        # Get depth multiplier
-        if deep_work_duration_before < 5:
-            multiplier = cls.DEPTH_MULTIPLIERS["shallow"]
-        elif deep_work_duration_before < 25:
-            multiplier = cls.DEPTH_MULTIPLIERS["building"]
-        else:
-            multiplier = cls.DEPTH_MULTIPLIERS["deep"]
+        depth = bisect_right(DEPTH_THRESHOLDS_MINUTES, deep_work_duration_before)
+        return _switch_cost(from_category, to_category, depth)
 
-        return base_cost * multiplier
+    @classmethod
+    def bulk_calculate_cost(
+        cls,
+        from_categories: Iterable[str],
+        to_categories: Iterable[str],
+        deep_work_durations_before: Iterable[float],
+    ) -> list[float]:
+        """Calculate the cost of many context switches at once.
+
+        Takes parallel sequences and chains map() over the depth bisect and
+        the memoized cost, so no Python frame is entered per switch once
+        the cost cache is warm.
+        """
+        depths = map(partial(bisect_right, DEPTH_THRESHOLDS_MINUTES), deep_work_durations_before)
+        return list(map(_switch_cost, from_categories, to_categories, depths))
+
+    def timestamp_iso(self) -> str | None:
+        """Return the timestamp in ISO format, formatted once per timestamp."""
+        timestamp = self.timestamp
+        if not timestamp:
+            return None
+        cached = self._timestamp_iso
+        if cached is None or cached[0] is not timestamp:
+            cached = self._timestamp_iso = (timestamp, timestamp.isoformat())
+        return cached[1]
+
+    def to_db_tuple(self) -> tuple[Any, ...]:
+        """Convert to a row in DB_COLUMNS order, for INSERT_SQL."""
+        return (
+            self.timestamp_iso(),
+            self.from_app,
+            self.from_category,
+            self.to_app,
+            self.to_category,
+            self.deep_work_duration_before,
+            self.estimated_cost_minutes,
+            self.actual_recovery_seconds,
+            self.switch_type,
+        )
 
     def to_db_dict(self) -> dict[str, Any]:
         """Convert to database dictionary."""
-        return {
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
-            "from_app": self.from_app,
-            "from_category": self.from_category,
-            "to_app": self.to_app,
-            "to_category": self.to_category,
-            "deep_work_duration_before": self.deep_work_duration_before,
-            "estimated_cost_minutes": self.estimated_cost_minutes,
-            "actual_recovery_seconds": self.actual_recovery_seconds,
-            "switch_type": self.switch_type.value if self.switch_type else None,
-        }
-
-
-@dataclass
+        return dict(zip(self.DB_COLUMNS, self.to_db_tuple()))
+
+
+# Base cost for category pairs missing from ContextSwitch.AFFINITY_COSTS
+DEFAULT_AFFINITY_COST = 1.5
+
+# Upper bounds (minutes) of the shallow and building depth levels; longer
+# stints are deep. Lines up with ContextSwitch.DEPTH_MULTIPLIERS order.
+DEPTH_THRESHOLDS_MINUTES = (5.0, 25.0)
+_DEPTH_MULTIPLIER_VALUES = tuple(ContextSwitch.DEPTH_MULTIPLIERS.values())
+
+# AFFINITY_COSTS flattened into a row-major table over small category ids
+_AFFINITY_CATEGORY_IDS = {
+    category: i
+    for i, category in enumerate(
+        dict.fromkeys(c for pair in ContextSwitch.AFFINITY_COSTS for c in pair)
+    )
+}
+_AFFINITY_TABLE = tuple(
+    ContextSwitch.AFFINITY_COSTS.get((from_category, to_category), DEFAULT_AFFINITY_COST)
+    for from_category in _AFFINITY_CATEGORY_IDS
+    for to_category in _AFFINITY_CATEGORY_IDS
+)
+
+
+@lru_cache(maxsize=512)
+def _switch_cost(from_category: str, to_category: str, depth: int) -> float:
+    """Cost in minutes of a switch between categories at a depth level."""
+    # Get base cost from the flattened affinity matrix
+    from_id = _AFFINITY_CATEGORY_IDS.get(from_category)
+    to_id = _AFFINITY_CATEGORY_IDS.get(to_category)
+    if from_id is None or to_id is None:
+        base_cost = DEFAULT_AFFINITY_COST
+    else:
+        base_cost = _AFFINITY_TABLE[from_id * len(_AFFINITY_CATEGORY_IDS) + to_id]
+    return base_cost * _DEPTH_MULTIPLIER_VALUES[depth]
+
+
+@dataclass(slots=True)
 class DailyOptimizationMetrics:
     """Pre-aggregated daily optimization metrics."""
 
@@ -237,39 +406,90 @@ class DailyOptimizationMetrics:
 
     # Savings potential
     potential_savings_minutes: float = 0.0
-    savings_breakdown: dict[str, float] = field(default_factory=dict)
+    savings_breakdown: dict[str, float] | None = None  # None until populated
+
+    # Column order of to_db_tuple(), matching INSERT_SQL
+    DB_COLUMNS = (
+        "date",
+        "total_tracked_minutes",
+        "deep_work_minutes",
+        "communication_minutes",
+        "meeting_minutes",
+        "admin_minutes",
+        "entertainment_minutes",
+        "interrupt_count",
+        "quick_check_count",
+        "avg_interrupt_duration_seconds",
+        "estimated_interrupt_cost_minutes",
+        "context_switch_count",
+        "estimated_switch_cost_minutes",
+        "meeting_count",
+        "usable_blocks_count",
+        "fragmented_blocks_count",
+        "swiss_cheese_score",
+        "delegate_minutes",
+        "eliminate_minutes",
+        "automate_minutes",
+        "leverage_minutes",
+        "potential_savings_minutes",
+        "savings_breakdown",
+    )
+    INSERT_SQL = _insert_sql("daily_optimization_metrics", DB_COLUMNS)
+    # Every column except the date key and the JSON savings breakdown
+    NUMERIC_FIELDS = DB_COLUMNS[1:-1]
+    # Reads all NUMERIC_FIELDS in one C-level call
+    _numeric_row = attrgetter(*NUMERIC_FIELDS)
+
+    @classmethod
+    def column_totals(
+        cls, metrics: list[DailyOptimizationMetrics]
+    ) -> dict[str, float]:
+        """Sum each numeric column across several days of metrics.
+
+        The rows are transposed into one tuple per column, so each total is
+        a single sum() instead of a per-day attribute walk.
+        """
+        columns = zip(*map(cls._numeric_row, metrics))
+        totals: dict[str, float] = dict(zip(cls.NUMERIC_FIELDS, map(sum, columns)))
+        return totals or dict.fromkeys(cls.NUMERIC_FIELDS, 0.0)
+
+    def reset(self, *, day: date_type) -> None:
+        """Clear the metrics in place so the instance can be reused for a day.
+
+        Rolling-window aggregation can step one instance through many days
+        instead of allocating a fresh one per day.
+        """
+        self.id = None
+        self.date = day
+        for name, default in _DAILY_NUMERIC_DEFAULTS:
+            setattr(self, name, default)
+        self.savings_breakdown = None
+
+    def to_db_tuple(self) -> tuple[Any, ...]:
+        """Convert to a row in DB_COLUMNS order, for INSERT_SQL.
+
+        An empty savings breakdown is stored as NULL rather than ``{}``.
+        """
+        return (
+            self.date.isoformat() if self.date else None,
+            *self._numeric_row(self),
+            _json_dumps(self.savings_breakdown) if self.savings_breakdown else None,
+        )
 
     def to_db_dict(self) -> dict[str, Any]:
         """Convert to database dictionary."""
-        import json
-        return {
-            "date": self.date.isoformat() if self.date else None,
-            "total_tracked_minutes": self.total_tracked_minutes,
-            "deep_work_minutes": self.deep_work_minutes,
-            "communication_minutes": self.communication_minutes,
-            "meeting_minutes": self.meeting_minutes,
-            "admin_minutes": self.admin_minutes,
-            "entertainment_minutes": self.entertainment_minutes,
-            "interrupt_count": self.interrupt_count,
-            "quick_check_count": self.quick_check_count,
-            "avg_interrupt_duration_seconds": self.avg_interrupt_duration_seconds,
-            "estimated_interrupt_cost_minutes": self.estimated_interrupt_cost_minutes,
-            "context_switch_count": self.context_switch_count,
-            "estimated_switch_cost_minutes": self.estimated_switch_cost_minutes,
-            "meeting_count": self.meeting_count,
-            "usable_blocks_count": self.usable_blocks_count,
-            "fragmented_blocks_count": self.fragmented_blocks_count,
-            "swiss_cheese_score": self.swiss_cheese_score,
-            "delegate_minutes": self.delegate_minutes,
-            "eliminate_minutes": self.eliminate_minutes,
-            "automate_minutes": self.automate_minutes,
-            "leverage_minutes": self.leverage_minutes,
-            "potential_savings_minutes": self.potential_savings_minutes,
-            "savings_breakdown": json.dumps(self.savings_breakdown),
-        }
+        return dict(zip(self.DB_COLUMNS, self.to_db_tuple()))
+
 
+# (field, default) pairs used by DailyOptimizationMetrics.reset()
+_DAILY_NUMERIC_DEFAULTS = tuple(
+    (f.name, f.default)
+    for f in fields(DailyOptimizationMetrics)
+    if f.name in DailyOptimizationMetrics.NUMERIC_FIELDS
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class WeeklyOptimizationInsights:
     """AI-generated weekly optimization insights."""
 
@@ -282,23 +502,23 @@ class WeeklyOptimizationInsights:
     deep_work_hours: float = 0.0
     time_saved_estimate: float = 0.0
 
-    # AI analysis
-    top_time_wasters: list[dict[str, Any]] = field(default_factory=list)
-    automation_opportunities: list[dict[str, Any]] = field(default_factory=list)
-    schedule_recommendations: list[dict[str, Any]] = field(default_factory=list)
+    # AI analysis (collections stay None until populated)
+    top_time_wasters: list[dict[str, Any]] | None = None
+    automation_opportunities: list[dict[str, Any]] | None = None
+    schedule_recommendations: list[dict[str, Any]] | None = None
 
     # Insights
     ai_narrative: str = ""
-    key_insights: list[str] = field(default_factory=list)
-    action_items: list[dict[str, Any]] = field(default_factory=list)
+    key_insights: list[str] | None = None
+    action_items: list[dict[str, Any]] | None = None
 
     # Comparison
-    vs_previous_week: dict[str, Any] = field(default_factory=dict)
+    vs_previous_week: dict[str, Any] | None = None
 
     model_used: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Nudge:
     """Real-time nudge for behavior change."""
 
@@ -310,19 +530,32 @@ class Nudge:
     urgency: str = "gentle"  # gentle, moderate, important
     was_dismissed: bool = False
     was_acted_upon: bool | None = None
+    _db_dict: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_db_dict(self) -> dict[str, Any]:
-        """Convert to database dictionary."""
+        """Convert to database dictionary.
+
+        Content and timestamp are fixed once a nudge is created, so that part
+        is built on first use and reused; each call returns a fresh dict with
+        the current outcome flags.
+        """
+        content = self._db_dict
+        if content is None:
+            content = self._db_dict = {
+                "timestamp": self.timestamp.isoformat() if self.timestamp else None,
+                "nudge_type": self.nudge_type,
+                "nudge_content": f"{self.message}\n{self.suggestion}",
+            }
         return {
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
-            "nudge_type": self.nudge_type.value,
-            "nudge_content": f"{self.message}\n{self.suggestion}",
+            **content,
             "was_dismissed": self.was_dismissed,
             "was_acted_upon": self.was_acted_upon,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Recommendation:
     """Time optimization recommendation."""
 
@@ -333,16 +566,18 @@ class Recommendation:
     suggested_behavior: str = ""
     estimated_savings_minutes: float = 0.0
     confidence: float = 0.0  # 0-1
-    evidence: list[str] = field(default_factory=list)
-    implementation_steps: list[str] = field(default_factory=list)
+    evidence: list[str] | None = None  # None until populated
+    implementation_steps: list[str] | None = None
     status: str = "pending"  # pending, accepted, dismissed
     created_at: datetime | None = None
     accepted_at: datetime | None = None
     dismissed_at: datetime | None = None
 
     def to_db_dict(self) -> dict[str, Any]:
-        """Convert to database dictionary."""
-        import json
+        """Convert to database dictionary.
+
+        Empty evidence and implementation steps are stored as NULL.
+        """
         return {
             "category": self.category,
             "title": self.title,
@@ -350,13 +585,17 @@ class Recommendation:
             "suggested_behavior": self.suggested_behavior,
             "estimated_savings_minutes": self.estimated_savings_minutes,
             "confidence": self.confidence,
-            "evidence": json.dumps(self.evidence),
-            "implementation_steps": json.dumps(self.implementation_steps),
+            "evidence": _json_dumps(self.evidence) if self.evidence else None,
+            "implementation_steps": (
+                _json_dumps(self.implementation_steps)
+                if self.implementation_steps
+                else None
+            ),
             "status": self.status,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class OptimizationStatus:
     """Status written to optimization_status.json for menu bar integration."""
 
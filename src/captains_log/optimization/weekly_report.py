@@ -6,10 +6,14 @@ and actionable recommendations based on time optimization data.
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
-from dataclasses import dataclass, field
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
+from operator import attrgetter, itemgetter
 from typing import Any
 
 from captains_log.optimization.schemas import DEALCategory
@@ -24,10 +28,57 @@ from captains_log.optimization.meeting_fragmentation import (
     WeeklyFragmentationMetrics,
 )
 
+try:
+    import orjson
+
+    def _dump_report(report: WeeklyReport) -> bytes:
+        # orjson encodes dataclasses and datetimes natively, producing the
+        # same document as to_dict() without building the intermediate dicts
+        return orjson.dumps(report)
+
+    _load_report: Callable[[str | bytes], Any] = orjson.loads
+
+except ImportError:
+    import json
+
+    def _dump_report(report: WeeklyReport) -> bytes:
+        return json.dumps(report.to_dict()).encode()
+
+    _load_report = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Saved reports kept in memory by get_report, most recently used last
+REPORT_CACHE_SIZE = 8
+
+# Columns written for each saved report, in _report_row order
+_REPORT_COLUMNS = (
+    "week_start",
+    "week_end",
+    "content",
+    "leverage_hours",
+    "eliminate_hours",
+    "savings_percent",
+    "created_at",
+)
+# Bulk save replaces the stored row of any week that is saved again
+_UPSERT_REPORT_SQL = (
+    f"INSERT INTO weekly_optimization_insights ({', '.join(_REPORT_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_REPORT_COLUMNS))}) "
+    "ON CONFLICT(week_start, week_end) DO UPDATE SET "
+    + ", ".join(f"{column} = excluded.{column}" for column in _REPORT_COLUMNS[2:])
+)
+
+# Bullet shown before each insight in to_text, by insight category
+INSIGHT_EMOJI = {
+    "pattern": "📊",
+    "opportunity": "💡",
+    "achievement": "🏆",
+    "warning": "⚠️",
+}
+
 
-@dataclass
+@dataclass(slots=True)
 class WeeklyTrend:
     """Trend data comparing this week to previous."""
 
@@ -38,6 +89,21 @@ class WeeklyTrend:
     is_improvement: bool
     unit: str = ""
 
+    # Reads every to_dict() value in field order in one C-level call
+    _dict_values = itemgetter(
+        "metric_name",
+        "current_value",
+        "previous_value",
+        "change_percent",
+        "is_improvement",
+        "unit",
+    )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> WeeklyTrend:
+        """Rebuild from a to_dict() mapping, passing values positionally."""
+        return cls(*cls._dict_values(data))
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "metric_name": self.metric_name,
@@ -49,7 +115,7 @@ class WeeklyTrend:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class WeeklyInsight:
     """An insight derived from weekly data."""
 
@@ -59,6 +125,19 @@ class WeeklyInsight:
     impact: str  # "high", "medium", "low"
     data_points: list[str] = field(default_factory=list)
 
+    _dict_values = itemgetter(
+        "category",
+        "title",
+        "description",
+        "impact",
+        "data_points",
+    )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> WeeklyInsight:
+        """Rebuild from a to_dict() mapping, passing values positionally."""
+        return cls(*cls._dict_values(data))
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "category": self.category,
@@ -69,7 +148,7 @@ class WeeklyInsight:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class WeeklyRecommendation:
     """A recommendation for the upcoming week."""
 
@@ -79,6 +158,19 @@ class WeeklyRecommendation:
     priority: int  # 1-3, 1 = highest
     category: str  # "eliminate", "automate", "delegate", "protect"
 
+    _dict_values = itemgetter(
+        "title",
+        "action",
+        "estimated_impact",
+        "priority",
+        "category",
+    )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> WeeklyRecommendation:
+        """Rebuild from a to_dict() mapping, passing values positionally."""
+        return cls(*cls._dict_values(data))
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "title": self.title,
@@ -89,7 +181,7 @@ class WeeklyRecommendation:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TimeSavingsProgress:
     """Progress toward time savings goal."""
 
@@ -101,6 +193,21 @@ class TimeSavingsProgress:
     total_saved_percent: float  # Actual savings percentage
     on_track: bool
 
+    _dict_values = itemgetter(
+        "goal_percent",
+        "baseline_hours",
+        "current_hours",
+        "eliminated_hours",
+        "automated_hours",
+        "total_saved_percent",
+        "on_track",
+    )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> TimeSavingsProgress:
+        """Rebuild from a to_dict() mapping, passing values positionally."""
+        return cls(*cls._dict_values(data))
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "goal_percent": self.goal_percent,
@@ -113,7 +220,7 @@ class TimeSavingsProgress:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class WeeklyReport:
     """Complete weekly optimization report."""
 
@@ -167,93 +274,265 @@ class WeeklyReport:
             "eliminate_hours": self.eliminate_hours,
             "automate_hours": self.automate_hours,
             "daily_stats": self.daily_stats,
-            "trends": [t.to_dict() for t in self.trends],
-            "insights": [i.to_dict() for i in self.insights],
-            "recommendations": [r.to_dict() for r in self.recommendations],
+            "trends": list(map(WeeklyTrend.to_dict, self.trends)),
+            "insights": list(map(WeeklyInsight.to_dict, self.insights)),
+            "recommendations": list(map(WeeklyRecommendation.to_dict, self.recommendations)),
             "savings_progress": self.savings_progress.to_dict() if self.savings_progress else None,
             "avg_swiss_cheese_score": self.avg_swiss_cheese_score,
             "best_focus_day": self.best_focus_day,
             "worst_focus_day": self.worst_focus_day,
         }
 
+    def copy(self) -> WeeklyReport:
+        """Return an independent copy; no stats, lists or items are shared."""
+        clone = replace(self)
+        clone.daily_stats = {day: dict(stats) for day, stats in self.daily_stats.items()}
+        clone.trends = list(map(replace, self.trends))
+        clone.insights = [
+            replace(insight, data_points=list(insight.data_points)) for insight in self.insights
+        ]
+        clone.recommendations = list(map(replace, self.recommendations))
+        if self.savings_progress is not None:
+            clone.savings_progress = replace(self.savings_progress)
+        return clone
+
     def to_text(self) -> str:
         """Generate human-readable report."""
+        week_range = (
+            f"{self.week_start.strftime('%B %d')} - {self.week_end.strftime('%B %d, %Y')}"
+        )
+        # Share of tracked time per DEAL category, resolved in one pass
+        total = self.total_tracked_hours
+        deal_hours = (
+            self.leverage_hours, self.delegate_hours, self.eliminate_hours, self.automate_hours
+        )
+        leverage_pct, delegate_pct, eliminate_pct, automate_pct = (
+            [int((hours / total) * 100) for hours in deal_hours] if total else (0, 0, 0, 0)
+        )
         lines = [
             "=" * 60,
             "WEEKLY TIME OPTIMIZATION REPORT",
-            f"Week of {self.week_start.strftime('%B %d')} - {self.week_end.strftime('%B %d, %Y')}",
+            f"Week of {week_range}",
             "=" * 60,
             "",
+            # Time Distribution
+            "## Time Distribution",
+            f"- Leverage (high-value): {self.leverage_hours:.1f}h ({leverage_pct}%)",
+            f"- Delegate (admin): {self.delegate_hours:.1f}h ({delegate_pct}%)",
+            f"- Eliminate (distractions): {self.eliminate_hours:.1f}h ({eliminate_pct}%)",
+            f"- Automate (repetitive): {self.automate_hours:.1f}h ({automate_pct}%)",
+            "",
+            # Key Stats
+            "## Key Stats",
+            f"- Total tracked: {self.total_tracked_hours:.1f} hours",
+            f"- Meetings: {self.total_meetings}",
+            f"- Interrupts: {self.total_interrupts}",
+            f"- Context switches: {self.total_context_switches}",
+            "",
         ]
 
-        # Time Distribution
-        lines.append("## Time Distribution")
-        lines.append(f"- Leverage (high-value): {self.leverage_hours:.1f}h ({self._percent(self.leverage_hours)}%)")
-        lines.append(f"- Delegate (admin): {self.delegate_hours:.1f}h ({self._percent(self.delegate_hours)}%)")
-        lines.append(f"- Eliminate (distractions): {self.eliminate_hours:.1f}h ({self._percent(self.eliminate_hours)}%)")
-        lines.append(f"- Automate (repetitive): {self.automate_hours:.1f}h ({self._percent(self.automate_hours)}%)")
-        lines.append("")
-
-        # Key Stats
-        lines.append("## Key Stats")
-        lines.append(f"- Total tracked: {self.total_tracked_hours:.1f} hours")
-        lines.append(f"- Meetings: {self.total_meetings}")
-        lines.append(f"- Interrupts: {self.total_interrupts}")
-        lines.append(f"- Context switches: {self.total_context_switches}")
-        lines.append("")
-
         # Trends
         if self.trends:
             lines.append("## vs. Last Week")
-            for trend in self.trends:
-                direction = "+" if trend.change_percent > 0 else ""
-                status = "✓" if trend.is_improvement else "✗"
-                lines.append(
-                    f"{status} {trend.metric_name}: {direction}{trend.change_percent:.0f}%"
-                )
+            lines.extend(
+                f"{'✓' if trend.is_improvement else '✗'} {trend.metric_name}: "
+                f"{'+' if trend.change_percent > 0 else ''}{trend.change_percent:.0f}%"
+                for trend in self.trends
+            )
             lines.append("")
 
         # Time Savings Progress
         if self.savings_progress:
-            lines.append("## Time Savings Progress")
-            lines.append(f"Goal: {self.savings_progress.goal_percent}%")
-            lines.append(f"Actual: {self.savings_progress.total_saved_percent:.1f}%")
-            status = "On track! 🎯" if self.savings_progress.on_track else "Needs attention"
-            lines.append(f"Status: {status}")
-            lines.append("")
+            progress = self.savings_progress
+            lines.extend((
+                "## Time Savings Progress",
+                f"Goal: {progress.goal_percent}%",
+                f"Actual: {progress.total_saved_percent:.1f}%",
+                f"Status: {'On track! 🎯' if progress.on_track else 'Needs attention'}",
+                "",
+            ))
 
         # Focus Quality
-        lines.append("## Focus Quality")
-        lines.append(f"- Swiss cheese score: {self.avg_swiss_cheese_score:.2f}")
-        lines.append(f"- Best focus day: {self.best_focus_day}")
-        lines.append(f"- Worst focus day: {self.worst_focus_day}")
-        lines.append("")
+        lines.extend((
+            "## Focus Quality",
+            f"- Swiss cheese score: {self.avg_swiss_cheese_score:.2f}",
+            f"- Best focus day: {self.best_focus_day}",
+            f"- Worst focus day: {self.worst_focus_day}",
+            "",
+        ))
 
         # Insights
         if self.insights:
             lines.append("## Key Insights")
             for insight in self.insights:
-                emoji = {"pattern": "📊", "opportunity": "💡", "achievement": "🏆", "warning": "⚠️"}
-                lines.append(f"{emoji.get(insight.category, '•')} {insight.title}")
-                lines.append(f"   {insight.description}")
+                lines.extend((
+                    f"{INSIGHT_EMOJI.get(insight.category, '•')} {insight.title}",
+                    f"   {insight.description}",
+                ))
             lines.append("")
 
         # Recommendations
         if self.recommendations:
             lines.append("## Top Recommendations")
             for i, rec in enumerate(self.recommendations[:3], 1):
-                lines.append(f"{i}. {rec.title}")
-                lines.append(f"   → {rec.action}")
-                lines.append(f"   Est. impact: {rec.estimated_impact}")
+                lines.extend((
+                    f"{i}. {rec.title}",
+                    f"   → {rec.action}",
+                    f"   Est. impact: {rec.estimated_impact}",
+                ))
             lines.append("")
 
         return "\n".join(lines)
 
-    def _percent(self, hours: float) -> int:
-        """Calculate percentage of total hours."""
-        if self.total_tracked_hours == 0:
-            return 0
-        return int((hours / self.total_tracked_hours) * 100)
+
+def _leverage_ratio(report: WeeklyReport) -> float:
+    """Share of tracked time spent on high-value work."""
+    return report.leverage_hours / report.total_tracked_hours
+
+
+# Insight rules as (predicate, factory) pairs, evaluated in order
+_INSIGHT_RULES: tuple[
+    tuple[Callable[[WeeklyReport], bool], Callable[[WeeklyReport], WeeklyInsight]], ...
+] = (
+    # High leverage ratio insight
+    (
+        lambda r: r.total_tracked_hours > 0 and _leverage_ratio(r) >= 0.5,
+        lambda r: WeeklyInsight(
+            category="achievement",
+            title="Strong Focus Week",
+            description=f"You spent {_leverage_ratio(r)*100:.0f}% of your time on high-value work",
+            impact="high",
+            data_points=[f"{r.leverage_hours:.1f} hours of deep work"],
+        ),
+    ),
+    (
+        lambda r: r.total_tracked_hours > 0 and _leverage_ratio(r) < 0.3,
+        lambda r: WeeklyInsight(
+            category="warning",
+            title="Low Deep Work Time",
+            description=f"Only {_leverage_ratio(r)*100:.0f}% of time was on high-value work",
+            impact="high",
+            data_points=[
+                "Target: 50%+",
+                f"Actual: {r.leverage_hours:.1f}h",
+            ],
+        ),
+    ),
+    # High elimination time
+    (
+        lambda r: r.eliminate_hours > 5,
+        lambda r: WeeklyInsight(
+            category="opportunity",
+            title="Reclaim Distraction Time",
+            description=f"You spent {r.eliminate_hours:.1f}h on distractions this week",
+            impact="high",
+            data_points=[
+                "Consider using website blockers",
+                "Set specific times for social media",
+            ],
+        ),
+    ),
+    # Interrupt pattern
+    (
+        lambda r: r.total_interrupts / 5 > 20,
+        lambda r: WeeklyInsight(
+            category="pattern",
+            title="High Interrupt Rate",
+            description=f"Average of {r.total_interrupts / 5:.0f} interrupts per day",
+            impact="medium",
+            data_points=[
+                "Check Slack/email less frequently",
+                "Consider batching to 3x/day",
+            ],
+        ),
+    ),
+    # Swiss cheese days
+    (
+        lambda r: r.avg_swiss_cheese_score > 0.5,
+        lambda r: WeeklyInsight(
+            category="warning",
+            title="Fragmented Schedule",
+            description="Meetings are creating too many small gaps",
+            impact="high",
+            data_points=[
+                f"Worst day: {r.worst_focus_day}",
+                "Consider meeting consolidation",
+            ],
+        ),
+    ),
+    # Best day insight
+    (
+        lambda r: bool(r.best_focus_day),
+        lambda r: WeeklyInsight(
+            category="pattern",
+            title=f"{r.best_focus_day} = Your Focus Day",
+            description=f"{r.best_focus_day} had the best focus score this week",
+            impact="low",
+            data_points=["Protect this day for deep work"],
+        ),
+    ),
+)
+
+# Recommendation rules as (predicate, factory) pairs, sorted by priority after
+_RECOMMENDATION_RULES: tuple[
+    tuple[Callable[[WeeklyReport], bool], Callable[[WeeklyReport], WeeklyRecommendation]], ...
+] = (
+    # High distraction time
+    (
+        lambda r: r.eliminate_hours > 5,
+        lambda r: WeeklyRecommendation(
+            title="Reduce Distraction Time",
+            action=f"Limit non-work browsing to 1h/day (currently {r.eliminate_hours/5:.1f}h/day)",
+            estimated_impact=f"Reclaim {r.eliminate_hours - 5:.1f} hours/week",
+            priority=1,
+            category="eliminate",
+        ),
+    ),
+    # High interrupt count
+    (
+        lambda r: r.total_interrupts > 100,
+        lambda r: WeeklyRecommendation(
+            title="Batch Communication Checks",
+            action="Check Slack/email only at 9am, 1pm, and 5pm",
+            estimated_impact="Save ~2 hours/week from reduced context switching",
+            priority=1,
+            category="automate",
+        ),
+    ),
+    # Meeting fragmentation
+    (
+        lambda r: r.avg_swiss_cheese_score > 0.4,
+        lambda r: WeeklyRecommendation(
+            title="Consolidate Meetings",
+            action=f"Move scattered meetings to {r.worst_focus_day or 'specific days'}",
+            estimated_impact="Create 2+ hour focus blocks",
+            priority=2,
+            category="delegate",
+        ),
+    ),
+    # Low deep work
+    (
+        lambda r: r.leverage_hours < 15,
+        lambda r: WeeklyRecommendation(
+            title="Protect Deep Work Time",
+            action="Block 9-11 AM daily for uninterrupted work",
+            estimated_impact=f"Add {20 - r.leverage_hours:.0f}h of productive time",
+            priority=1,
+            category="protect",
+        ),
+    ),
+    # High context switches
+    (
+        lambda r: r.total_context_switches > 200,
+        lambda r: WeeklyRecommendation(
+            title="Reduce Context Switching",
+            action="Work in 45-minute focused blocks with 5-minute breaks",
+            estimated_impact="Reduce mental fatigue and improve focus",
+            priority=2,
+            category="automate",
+        ),
+    ),
+)
 
 
 class WeeklyReportGenerator:
@@ -279,14 +558,19 @@ class WeeklyReportGenerator:
         self.context_switch_analyzer = ContextSwitchAnalyzer(db=db)
         self.fragmentation_analyzer = MeetingFragmentationAnalyzer(db=db)
 
+        # Saved reports keyed by week start (YYYY-MM-DD), LRU order
+        self._report_cache: OrderedDict[str, WeeklyReport] = OrderedDict()
+
     async def generate_report(
         self,
         week_start: datetime | None = None,
+        save: bool = True,
     ) -> WeeklyReport:
         """Generate a weekly report.
 
         Args:
             week_start: Start of the week (defaults to most recent Monday)
+            save: Store the report; pass False to collect reports for save_many
 
         Returns:
             Complete WeeklyReport
@@ -305,22 +589,23 @@ class WeeklyReportGenerator:
             generated_at=datetime.utcnow(),
         )
 
-        if self.db:
-            # Gather daily metrics
-            await self._gather_daily_metrics(report, week_start)
+        # Without a database there is no data to analyze or store
+        if not self.db:
+            return report
 
-            # Calculate trends
-            previous_week_start = week_start - timedelta(days=7)
-            report.trends = await self._calculate_trends(
-                week_start, previous_week_start
-            )
+        # Gather daily metrics
+        await self._gather_daily_metrics(report, week_start)
 
-            # Analyze fragmentation
-            frag_metrics = await self.fragmentation_analyzer.analyze_week(week_start)
-            report.avg_swiss_cheese_score = frag_metrics.avg_swiss_cheese_score
-            report.best_focus_day = frag_metrics.best_focus_day
-            report.worst_focus_day = frag_metrics.worst_focus_day
-            report.total_meetings = frag_metrics.total_meetings
+        # Calculate trends
+        previous_week_start = week_start - timedelta(days=7)
+        report.trends = await self._calculate_trends(report, previous_week_start)
+
+        # Analyze fragmentation
+        frag_metrics = await self.fragmentation_analyzer.analyze_week(week_start)
+        report.avg_swiss_cheese_score = frag_metrics.avg_swiss_cheese_score
+        report.best_focus_day = frag_metrics.best_focus_day
+        report.worst_focus_day = frag_metrics.worst_focus_day
+        report.total_meetings = frag_metrics.total_meetings
 
         # Generate insights
         report.insights = self._generate_insights(report)
@@ -332,7 +617,8 @@ class WeeklyReportGenerator:
         report.savings_progress = self._calculate_savings_progress(report)
 
         # Save report
-        await self._save_report(report)
+        if save:
+            await self._save_report(report)
 
         return report
 
@@ -343,37 +629,50 @@ class WeeklyReportGenerator:
     ) -> None:
         """Gather metrics for each day of the week."""
         day_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
+        week_last_day = week_start + timedelta(days=len(day_names) - 1)
 
-        for i, day_name in enumerate(day_names):
-            day_date = week_start + timedelta(days=i)
-
-            # Get DEAL metrics
-            deal_metrics = await self.deal_classifier.get_daily_metrics(day_date)
-
-            # Get interrupt metrics
-            interrupt_metrics = await self.interrupt_detector.get_daily_metrics(day_date)
+        # One grouped query per analyzer covers the whole work week
+        deal_by_day, interrupts_by_day, switches_by_day = await asyncio.gather(
+            self.deal_classifier.get_metrics_by_day(week_start, week_last_day),
+            self.interrupt_detector.get_daily_counts(week_start, week_last_day),
+            self.context_switch_analyzer.get_daily_counts(week_start, week_last_day),
+        )
 
-            # Get switch metrics
-            switch_metrics = await self.context_switch_analyzer.get_daily_metrics(day_date)
+        # Per-day (leverage, delegate, eliminate, automate) minutes
+        deal_minutes = []
+        for i, day_name in enumerate(day_names):
+            day_key = (week_start + timedelta(days=i)).strftime("%Y-%m-%d")
+            deal_metrics = deal_by_day.get(day_key) or DEALMetrics()
+            interrupts = interrupts_by_day.get(day_key, 0)
+            switches = switches_by_day.get(day_key, 0)
+            minutes = (
+                deal_metrics.leverage_minutes,
+                deal_metrics.delegate_minutes,
+                deal_metrics.eliminate_minutes,
+                deal_metrics.automate_minutes,
+            )
+            deal_minutes.append(minutes)
 
             # Store daily stats
             report.daily_stats[day_name] = {
-                "leverage_minutes": deal_metrics.leverage_minutes,
-                "delegate_minutes": deal_metrics.delegate_minutes,
-                "eliminate_minutes": deal_metrics.eliminate_minutes,
-                "automate_minutes": deal_metrics.automate_minutes,
-                "interrupts": interrupt_metrics.total_interrupts,
-                "context_switches": switch_metrics.total_switches,
+                "leverage_minutes": minutes[0],
+                "delegate_minutes": minutes[1],
+                "eliminate_minutes": minutes[2],
+                "automate_minutes": minutes[3],
+                "interrupts": interrupts,
+                "context_switches": switches,
             }
 
-            # Aggregate to weekly totals
-            report.leverage_hours += deal_metrics.leverage_minutes / 60.0
-            report.delegate_hours += deal_metrics.delegate_minutes / 60.0
-            report.eliminate_hours += deal_metrics.eliminate_minutes / 60.0
-            report.automate_hours += deal_metrics.automate_minutes / 60.0
-            report.total_interrupts += interrupt_metrics.total_interrupts
-            report.total_context_switches += switch_metrics.total_switches
+            report.total_interrupts += interrupts
+            report.total_context_switches += switches
 
+        # Aggregate to weekly totals with one column-wise sum
+        (
+            report.leverage_hours,
+            report.delegate_hours,
+            report.eliminate_hours,
+            report.automate_hours,
+        ) = (sum(column) / 60.0 for column in zip(*deal_minutes))
         report.total_tracked_hours = (
             report.leverage_hours + report.delegate_hours +
             report.eliminate_hours + report.automate_hours
@@ -381,32 +680,27 @@ class WeeklyReportGenerator:
 
     async def _calculate_trends(
         self,
-        current_week: datetime,
+        report: WeeklyReport,
         previous_week: datetime,
     ) -> list[WeeklyTrend]:
-        """Calculate trends comparing two weeks."""
+        """Calculate trends comparing the report's week to a previous one.
+
+        The current week's totals come from the already gathered report, so
+        only the previous week is queried.
+        """
         trends = []
 
-        # Get metrics for both weeks
-        current_leverage = 0.0
-        current_interrupts = 0
-        previous_leverage = 0.0
-        previous_interrupts = 0
-
-        for i in range(5):  # Mon-Fri
-            # Current week
-            day = current_week + timedelta(days=i)
-            deal = await self.deal_classifier.get_daily_metrics(day)
-            interrupt = await self.interrupt_detector.get_daily_metrics(day)
-            current_leverage += deal.leverage_minutes / 60.0
-            current_interrupts += interrupt.total_interrupts
-
-            # Previous week
-            prev_day = previous_week + timedelta(days=i)
-            prev_deal = await self.deal_classifier.get_daily_metrics(prev_day)
-            prev_interrupt = await self.interrupt_detector.get_daily_metrics(prev_day)
-            previous_leverage += prev_deal.leverage_minutes / 60.0
-            previous_interrupts += prev_interrupt.total_interrupts
+        # Get Mon-Fri metrics for the previous week
+        previous_end = previous_week + timedelta(days=4)
+        previous_deal, previous_counts = await asyncio.gather(
+            self.deal_classifier.get_metrics_by_day(previous_week, previous_end),
+            self.interrupt_detector.get_daily_counts(previous_week, previous_end),
+        )
+
+        current_leverage = report.leverage_hours
+        current_interrupts = report.total_interrupts
+        previous_leverage = sum(d.leverage_minutes / 60.0 for d in previous_deal.values())
+        previous_interrupts = sum(previous_counts.values())
 
         # Deep work trend
         if previous_leverage > 0:
@@ -436,142 +730,19 @@ class WeeklyReportGenerator:
 
     def _generate_insights(self, report: WeeklyReport) -> list[WeeklyInsight]:
         """Generate insights from report data."""
-        insights = []
-
-        # High leverage ratio insight
-        if report.total_tracked_hours > 0:
-            leverage_ratio = report.leverage_hours / report.total_tracked_hours
-            if leverage_ratio >= 0.5:
-                insights.append(WeeklyInsight(
-                    category="achievement",
-                    title="Strong Focus Week",
-                    description=f"You spent {leverage_ratio*100:.0f}% of your time on high-value work",
-                    impact="high",
-                    data_points=[f"{report.leverage_hours:.1f} hours of deep work"],
-                ))
-            elif leverage_ratio < 0.3:
-                insights.append(WeeklyInsight(
-                    category="warning",
-                    title="Low Deep Work Time",
-                    description=f"Only {leverage_ratio*100:.0f}% of time was on high-value work",
-                    impact="high",
-                    data_points=[
-                        f"Target: 50%+",
-                        f"Actual: {report.leverage_hours:.1f}h",
-                    ],
-                ))
-
-        # High elimination time
-        if report.eliminate_hours > 5:
-            insights.append(WeeklyInsight(
-                category="opportunity",
-                title="Reclaim Distraction Time",
-                description=f"You spent {report.eliminate_hours:.1f}h on distractions this week",
-                impact="high",
-                data_points=[
-                    "Consider using website blockers",
-                    "Set specific times for social media",
-                ],
-            ))
-
-        # Interrupt pattern
-        avg_daily_interrupts = report.total_interrupts / 5
-        if avg_daily_interrupts > 20:
-            insights.append(WeeklyInsight(
-                category="pattern",
-                title="High Interrupt Rate",
-                description=f"Average of {avg_daily_interrupts:.0f} interrupts per day",
-                impact="medium",
-                data_points=[
-                    "Check Slack/email less frequently",
-                    "Consider batching to 3x/day",
-                ],
-            ))
-
-        # Swiss cheese days
-        if report.avg_swiss_cheese_score > 0.5:
-            insights.append(WeeklyInsight(
-                category="warning",
-                title="Fragmented Schedule",
-                description="Meetings are creating too many small gaps",
-                impact="high",
-                data_points=[
-                    f"Worst day: {report.worst_focus_day}",
-                    "Consider meeting consolidation",
-                ],
-            ))
-
-        # Best day insight
-        if report.best_focus_day:
-            insights.append(WeeklyInsight(
-                category="pattern",
-                title=f"{report.best_focus_day} = Your Focus Day",
-                description=f"{report.best_focus_day} had the best focus score this week",
-                impact="low",
-                data_points=["Protect this day for deep work"],
-            ))
-
-        return insights
+        return [factory(report) for matches, factory in _INSIGHT_RULES if matches(report)]
 
     def _generate_recommendations(
         self,
         report: WeeklyReport,
     ) -> list[WeeklyRecommendation]:
         """Generate prioritized recommendations."""
-        recommendations = []
-
-        # High distraction time
-        if report.eliminate_hours > 5:
-            recommendations.append(WeeklyRecommendation(
-                title="Reduce Distraction Time",
-                action=f"Limit non-work browsing to 1h/day (currently {report.eliminate_hours/5:.1f}h/day)",
-                estimated_impact=f"Reclaim {report.eliminate_hours - 5:.1f} hours/week",
-                priority=1,
-                category="eliminate",
-            ))
-
-        # High interrupt count
-        if report.total_interrupts > 100:
-            recommendations.append(WeeklyRecommendation(
-                title="Batch Communication Checks",
-                action="Check Slack/email only at 9am, 1pm, and 5pm",
-                estimated_impact="Save ~2 hours/week from reduced context switching",
-                priority=1,
-                category="automate",
-            ))
-
-        # Meeting fragmentation
-        if report.avg_swiss_cheese_score > 0.4:
-            recommendations.append(WeeklyRecommendation(
-                title="Consolidate Meetings",
-                action=f"Move scattered meetings to {report.worst_focus_day or 'specific days'}",
-                estimated_impact="Create 2+ hour focus blocks",
-                priority=2,
-                category="delegate",
-            ))
-
-        # Low deep work
-        if report.leverage_hours < 15:
-            recommendations.append(WeeklyRecommendation(
-                title="Protect Deep Work Time",
-                action="Block 9-11 AM daily for uninterrupted work",
-                estimated_impact=f"Add {20 - report.leverage_hours:.0f}h of productive time",
-                priority=1,
-                category="protect",
-            ))
-
-        # High context switches
-        if report.total_context_switches > 200:
-            recommendations.append(WeeklyRecommendation(
-                title="Reduce Context Switching",
-                action="Work in 45-minute focused blocks with 5-minute breaks",
-                estimated_impact="Reduce mental fatigue and improve focus",
-                priority=2,
-                category="automate",
-            ))
+        recommendations = [
+            factory(report) for matches, factory in _RECOMMENDATION_RULES if matches(report)
+        ]
 
         # Sort by priority
-        recommendations.sort(key=lambda r: r.priority)
+        recommendations.sort(key=attrgetter("priority"))
 
         return recommendations
 
@@ -606,23 +777,58 @@ class WeeklyReportGenerator:
         if not self.db:
             return 0
 
+        self._report_cache.pop(report.week_start.strftime("%Y-%m-%d"), None)
+
         try:
             return await self.db.insert(
-                "weekly_optimization_insights",
-                {
-                    "week_start": report.week_start.strftime("%Y-%m-%d"),
-                    "week_end": report.week_end.strftime("%Y-%m-%d"),
-                    "content": json.dumps(report.to_dict()),
-                    "leverage_hours": report.leverage_hours,
-                    "eliminate_hours": report.eliminate_hours,
-                    "savings_percent": report.savings_progress.total_saved_percent if report.savings_progress else 0,
-                    "created_at": datetime.utcnow().isoformat(),
-                },
+                "weekly_optimization_insights", self._report_row(report)
             )
         except Exception as e:
             logger.warning(f"Failed to save weekly report: {e}")
             return 0
 
+    async def save_many(self, reports: list[WeeklyReport]) -> None:
+        """Save several reports in a single transaction.
+
+        Weeks that are already stored are overwritten, so reports produced
+        with ``generate_report(save=False)`` can backfill or regenerate
+        past weeks.
+
+        Args:
+            reports: The reports to save
+        """
+        if not self.db:
+            return
+
+        params = []
+        for report in reports:
+            row = self._report_row(report)
+            self._report_cache.pop(row["week_start"], None)
+            params.append(tuple(row.values()))
+
+        try:
+            await self.db.execute_many(_UPSERT_REPORT_SQL, params)
+        except Exception as e:
+            logger.warning(f"Failed to save weekly reports: {e}")
+
+    def _report_row(self, report: WeeklyReport) -> dict[str, Any]:
+        """Build the weekly_optimization_insights row for a report.
+
+        Keys follow _REPORT_COLUMNS order.
+        """
+        return {
+            "week_start": report.week_start.strftime("%Y-%m-%d"),
+            "week_end": report.week_end.strftime("%Y-%m-%d"),
+            # BLOB column holding zlib-compressed JSON
+            "content": zlib.compress(_dump_report(report)),
+            "leverage_hours": report.leverage_hours,
+            "eliminate_hours": report.eliminate_hours,
+            "savings_percent": (
+                report.savings_progress.total_saved_percent if report.savings_progress else 0
+            ),
+            "created_at": datetime.utcnow().isoformat(),
+        }
+
     async def get_report(
         self,
         week_start: datetime | None = None,
@@ -644,6 +850,12 @@ class WeeklyReportGenerator:
 
         week_str = week_start.strftime("%Y-%m-%d")
 
+        cached = self._report_cache.get(week_str)
+        if cached is not None:
+            self._report_cache.move_to_end(week_str)
+            # Callers get their own copy so edits never reach the cache
+            return cached.copy()
+
         row = await self.db.fetch_one(
             "SELECT * FROM weekly_optimization_insights WHERE week_start = ?",
             (week_str,),
@@ -652,7 +864,63 @@ class WeeklyReportGenerator:
         if not row:
             return None
 
-        content = json.loads(row["content"])
+        report = self._row_to_report(row)
+        self._cache_report(week_str, report)
+        return report
+
+    async def get_reports(
+        self,
+        week_starts: list[datetime],
+    ) -> dict[str, WeeklyReport]:
+        """Get several saved reports with a single query.
+
+        Args:
+            week_starts: Starts of the weeks to retrieve
+
+        Returns:
+            Reports keyed by week start (YYYY-MM-DD); missing weeks are omitted
+        """
+        if not self.db:
+            return {}
+
+        reports: dict[str, WeeklyReport] = {}
+        missing: list[str] = []
+        for week_start in week_starts:
+            week_str = week_start.strftime("%Y-%m-%d")
+            cached = self._report_cache.get(week_str)
+            if cached is not None:
+                self._report_cache.move_to_end(week_str)
+                reports[week_str] = cached.copy()
+            else:
+                missing.append(week_str)
+
+        if missing:
+            placeholders = ", ".join("?" * len(missing))
+            rows = await self.db.fetch_all(
+                "SELECT * FROM weekly_optimization_insights "
+                f"WHERE week_start IN ({placeholders})",
+                tuple(missing),
+            )
+            for row in rows:
+                report = self._row_to_report(row)
+                reports[row["week_start"]] = report
+                self._cache_report(row["week_start"], report)
+
+        return reports
+
+    def _cache_report(self, week_str: str, report: WeeklyReport) -> None:
+        """Remember a copy of a loaded report, evicting the least recently used."""
+        self._report_cache[week_str] = report.copy()
+        if len(self._report_cache) > REPORT_CACHE_SIZE:
+            self._report_cache.popitem(last=False)
+
+    def _row_to_report(self, row: dict[str, Any]) -> WeeklyReport:
+        """Reconstruct a report from a weekly_optimization_insights row."""
+        content = row["content"]
+        # Reports are stored as zlib-compressed JSON; older rows hold plain text
+        if isinstance(content, bytes):
+            content = zlib.decompress(content)
+        content = _load_report(content)
 
         # Reconstruct the report from saved content
         report = WeeklyReport(
@@ -673,13 +941,13 @@ class WeeklyReportGenerator:
         )
 
         # Reconstruct nested objects
-        report.trends = [WeeklyTrend(**t) for t in content.get("trends", [])]
-        report.insights = [WeeklyInsight(**i) for i in content.get("insights", [])]
-        report.recommendations = [
-            WeeklyRecommendation(**r) for r in content.get("recommendations", [])
-        ]
+        report.trends = list(map(WeeklyTrend.from_dict, content.get("trends", [])))
+        report.insights = list(map(WeeklyInsight.from_dict, content.get("insights", [])))
+        report.recommendations = list(
+            map(WeeklyRecommendation.from_dict, content.get("recommendations", []))
+        )
 
         if content.get("savings_progress"):
-            report.savings_progress = TimeSavingsProgress(**content["savings_progress"])
+            report.savings_progress = TimeSavingsProgress.from_dict(content["savings_progress"])
 
         return report
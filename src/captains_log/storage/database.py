@@ -17,7 +17,7 @@ import aiosqlite
 logger = logging.getLogger(__name__)
 
 # Schema version for migrations
-SCHEMA_VERSION = 9
+SCHEMA_VERSION = 11
 
 # Database schema
 SCHEMA = """
@@ -45,6 +45,7 @@ CREATE TABLE IF NOT EXISTS activity_logs (
 CREATE INDEX IF NOT EXISTS idx_activity_ts ON activity_logs(timestamp);
 CREATE INDEX IF NOT EXISTS idx_activity_app ON activity_logs(bundle_id);
 CREATE INDEX IF NOT EXISTS idx_activity_created ON activity_logs(created_at);
+CREATE INDEX IF NOT EXISTS idx_activity_date_app ON activity_logs(date(timestamp), app_name);
 
 -- Screenshot metadata
 CREATE TABLE IF NOT EXISTS screenshots (
@@ -891,6 +892,57 @@ class Database:
 
             logger.info("Migration v8 -> v9 complete")
 
+        # Migration from version 9 to 10: Add nudge acknowledge/dismiss times
+        if from_version < 10:
+            logger.info("Running migration v9 -> v10: Adding nudge response timestamps")
+
+            # Stored as integer epoch milliseconds
+            async with self._connection.execute("PRAGMA table_info(nudge_history)") as cursor:
+                existing_cols = {row[1] for row in await cursor.fetchall()}
+
+            for col_name in ("acknowledged_at_ms", "dismissed_at_ms"):
+                if col_name not in existing_cols:
+                    try:
+                        await self._connection.execute(
+                            f"ALTER TABLE nudge_history ADD COLUMN {col_name} INTEGER"
+                        )
+                        logger.debug(f"Added column {col_name} to nudge_history")
+                    except sqlite3.OperationalError as e:
+                        if "duplicate column name" not in str(e).lower():
+                            raise
+
+            logger.info("Migration v9 -> v10 complete")
+
+        # Migration from version 10 to 11: Add weekly report content columns
+        if from_version < 11:
+            logger.info("Running migration v10 -> v11: Adding weekly report content")
+
+            # WeeklyReportGenerator stores the full report in content as
+            # zlib-compressed JSON, hence BLOB rather than JSON
+            async with self._connection.execute(
+                "PRAGMA table_info(weekly_optimization_insights)"
+            ) as cursor:
+                existing_cols = {row[1] for row in await cursor.fetchall()}
+
+            for col_name, col_type in (
+                ("content", "BLOB"),
+                ("leverage_hours", "REAL"),
+                ("eliminate_hours", "REAL"),
+                ("savings_percent", "REAL"),
+            ):
+                if col_name not in existing_cols:
+                    try:
+                        await self._connection.execute(
+                            "ALTER TABLE weekly_optimization_insights "
+                            f"ADD COLUMN {col_name} {col_type}"
+                        )
+                        logger.debug(f"Added column {col_name} to weekly_optimization_insights")
+                    except sqlite3.OperationalError as e:
+                        if "duplicate column name" not in str(e).lower():
+                            raise
+
+            logger.info("Migration v10 -> v11 complete")
+
     async def close(self) -> None:
         """Close database connection."""
         if self._connection:
@@ -927,11 +979,11 @@ class Database:
     async def execute_many(
         self, query: str, params_list: list[tuple[Any, ...]]
     ) -> None:
-        """Execute a query with multiple parameter sets."""
+        """Execute a query with multiple parameter sets in one transaction."""
         if self._connection is None:
             raise RuntimeError("Database not connected")
 
-        async with self._lock:
+        async with self.transaction():
             await self._connection.executemany(query, params_list)
 
     async def fetch_one(
@@ -958,6 +1010,18 @@ class Database:
             rows = await cursor.fetchall()
             return [dict(row) for row in rows]
 
+    async def iterate(
+        self, query: str, params: tuple[Any, ...] = (), batch_size: int = 500
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield rows one at a time, fetching them from the cursor in batches."""
+        if self._connection is None:
+            raise RuntimeError("Database not connected")
+
+        async with self._connection.execute(query, params) as cursor:
+            while rows := await cursor.fetchmany(batch_size):
+                for row in rows:
+                    yield dict(row)
+
     async def insert(self, table: str, data: dict[str, Any]) -> int:
         """Insert a row into a table."""
         columns = ", ".join(data.keys())
@@ -965,6 +1029,16 @@ class Database:
         query = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
         return await self.execute(query, tuple(data.values()))
 
+    async def insert_many(self, table: str, rows: list[dict[str, Any]]) -> None:
+        """Insert rows sharing the same columns in a single transaction."""
+        if not rows:
+            return
+
+        columns = ", ".join(rows[0].keys())
+        placeholders = ", ".join("?" * len(rows[0]))
+        query = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+        await self.execute_many(query, [tuple(row.values()) for row in rows])
+
     async def check_integrity(self) -> bool:
         """Check database integrity."""
         if self._connection is None:
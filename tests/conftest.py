@@ -0,0 +1,19 @@
+"""Shared fixtures."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+
+from captains_log.storage.database import Database
+
+
+@pytest.fixture
+async def db(tmp_path: Path) -> AsyncIterator[Database]:
+    """A migrated database in a temporary directory."""
+    database = Database(tmp_path / "captains_log.db")
+    await database.connect()
+    yield database
+    await database.close()
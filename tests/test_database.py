@@ -0,0 +1,49 @@
+"""Tests for database schema migrations."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from captains_log.storage.database import SCHEMA_VERSION, Database
+
+
+async def _column_types(db: Database, table: str) -> dict[str, str]:
+    rows = await db.fetch_all(f"PRAGMA table_info({table})")
+    return {row["name"]: row["type"] for row in rows}
+
+
+async def _schema_version(db: Database) -> int:
+    row = await db.fetch_one("SELECT MAX(version) AS version FROM schema_version")
+    assert row is not None
+    return int(row["version"])
+
+
+async def test_new_database_has_current_columns(db: Database) -> None:
+    assert await _schema_version(db) == SCHEMA_VERSION
+
+    nudge_columns = await _column_types(db, "nudge_history")
+    assert nudge_columns["acknowledged_at_ms"] == "INTEGER"
+    assert nudge_columns["dismissed_at_ms"] == "INTEGER"
+
+    report_columns = await _column_types(db, "weekly_optimization_insights")
+    assert report_columns["content"] == "BLOB"
+    assert report_columns["leverage_hours"] == "REAL"
+    assert report_columns["eliminate_hours"] == "REAL"
+    assert report_columns["savings_percent"] == "REAL"
+
+
+async def test_migrations_rerun_over_existing_columns(tmp_path: Path) -> None:
+    db = Database(tmp_path / "captains_log.db")
+    await db.connect()
+    # Pretend the database stopped at v9 although the columns already exist
+    await db.execute("DELETE FROM schema_version")
+    await db.execute("INSERT INTO schema_version (version) VALUES (9)")
+    await db.close()
+
+    db = Database(tmp_path / "captains_log.db")
+    await db.connect()
+    try:
+        assert await _schema_version(db) == SCHEMA_VERSION
+        assert "content" in await _column_types(db, "weekly_optimization_insights")
+    finally:
+        await db.close()
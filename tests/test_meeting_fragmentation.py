@@ -0,0 +1,136 @@
+"""Tests for meeting detection and the past-day fragmentation cache."""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta
+from typing import Any
+
+from captains_log.optimization.meeting_fragmentation import (
+    MIN_MEETING_DURATION,
+    FragmentationMetrics,
+    MeetingFragmentationAnalyzer,
+    TimeBlock,
+)
+from captains_log.storage.database import Database
+
+APPS = [
+    ("Zoom", "us.zoom.xos"),
+    ("Microsoft Teams", None),
+    ("Huddle", "com.apple.FaceTime"),  # matched by bundle id only
+    ("Slack", "com.tinyspeck.slackmacgap"),
+    ("Code", "com.microsoft.VSCode"),
+    ("Safari", "com.apple.Safari"),
+    ("Terminal", None),
+]
+
+
+def _reference_meeting_blocks(
+    analyzer: MeetingFragmentationAnalyzer, rows: list[dict[str, Any]]
+) -> list[TimeBlock]:
+    """Group consecutive meeting-app rows in Python, row by row."""
+    meetings: list[TimeBlock] = []
+    current: dict[str, Any] | None = None
+
+    def close() -> None:
+        if current and (current["end"] - current["start"]).total_seconds() / 60.0 >= (
+            MIN_MEETING_DURATION
+        ):
+            meetings.append(TimeBlock(block_type="meeting", **current))
+
+    for row in rows:
+        timestamp = datetime.fromisoformat(row["timestamp"])
+        if analyzer.is_meeting_app(row["app_name"], row["bundle_id"]):
+            if current is None:
+                current = {"start": timestamp, "end": timestamp, "app_name": row["app_name"]}
+            else:
+                current["end"] = timestamp
+        else:
+            close()
+            current = None
+    close()
+    return meetings
+
+
+def _generated_day(rng: random.Random, day: datetime) -> list[dict[str, Any]]:
+    """Activity every 1-3 minutes across the work day, in sticky app runs."""
+    rows = []
+    timestamp = day.replace(hour=9)
+    app_name, bundle_id = rng.choice(APPS)
+    while timestamp.hour < 18:
+        if rng.random() < 0.15:
+            app_name, bundle_id = rng.choice(APPS)
+        rows.append({
+            "timestamp": timestamp.isoformat(),
+            "app_name": app_name,
+            "bundle_id": bundle_id,
+        })
+        timestamp += timedelta(minutes=rng.randint(1, 3))
+    return rows
+
+
+async def test_meeting_runs_match_row_by_row_detection(db: Database) -> None:
+    rng = random.Random(7)
+    first_day = datetime(2026, 3, 2)
+    days = [first_day + timedelta(days=i) for i in range(5)]
+    rows_by_day = {day: _generated_day(rng, day) for day in days}
+    for rows in rows_by_day.values():
+        await db.insert_many("activity_logs", rows)
+
+    analyzer = MeetingFragmentationAnalyzer(db=db)
+    results = await analyzer._analyze_days(first_day, len(days))
+
+    for day, metrics in zip(days, results):
+        expected = _reference_meeting_blocks(analyzer, rows_by_day[day])
+        assert expected, "generated day should contain meetings"
+        assert metrics._meeting_blocks == expected
+        reference = analyzer._analyze_fragmentation(expected, day)
+        assert metrics.to_dict() == reference.to_dict()
+
+
+async def test_day_without_activity_is_empty(db: Database) -> None:
+    analyzer = MeetingFragmentationAnalyzer(db=db)
+    metrics = await analyzer.analyze_day(datetime(2026, 3, 2))
+    assert metrics.to_dict() == FragmentationMetrics().to_dict()
+
+
+async def test_day_cache_reused_until_new_activity(db: Database) -> None:
+    day = datetime(2026, 3, 2)
+    await db.insert_many("activity_logs", [
+        {"timestamp": day.replace(hour=10).isoformat(), "app_name": "Zoom"},
+        {"timestamp": day.replace(hour=11).isoformat(), "app_name": "Zoom"},
+        {"timestamp": day.replace(hour=11, minute=1).isoformat(), "app_name": "Code"},
+    ])
+    analyzer = MeetingFragmentationAnalyzer(db=db)
+
+    first = await analyzer.analyze_day(day)
+    assert first.total_meetings == 1
+    assert len(analyzer._day_cache) == 1
+
+    # A cached day is served as a copy, so caller edits do not leak back
+    first.total_meetings = 99
+    first.time_blocks.clear()
+    second = await analyzer.analyze_day(day)
+    assert second.total_meetings == 1
+    assert second.time_blocks
+
+    # A later row for the same day changes MAX(id) and forces a recompute
+    await db.insert_many("activity_logs", [
+        {"timestamp": day.replace(hour=14).isoformat(), "app_name": "Zoom"},
+        {"timestamp": day.replace(hour=15).isoformat(), "app_name": "Zoom"},
+        {"timestamp": day.replace(hour=15, minute=1).isoformat(), "app_name": "Code"},
+    ])
+    third = await analyzer.analyze_day(day)
+    assert third.total_meetings == 2
+    assert len(analyzer._day_cache) == 2
+
+
+def test_time_blocks_accepted_by_constructor() -> None:
+    block = TimeBlock(
+        start=datetime(2026, 3, 2, 9),
+        end=datetime(2026, 3, 2, 10),
+        block_type="meeting",
+    )
+    metrics = FragmentationMetrics(total_meetings=1, time_blocks=[block])
+    assert metrics.time_blocks == [block]
+    assert metrics.copy().time_blocks == [block]
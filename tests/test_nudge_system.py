@@ -0,0 +1,102 @@
+"""Tests for nudge cooldowns and batched nudge history writes."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from captains_log.optimization import nudge_system
+from captains_log.optimization.nudge_system import Cooldown, NudgeQueue
+from captains_log.optimization.schemas import Nudge, NudgeType
+from captains_log.storage.database import Database
+
+
+class TestCooldown:
+    def test_ready_before_first_trigger(self) -> None:
+        assert Cooldown(60).ready()
+
+    def test_not_ready_until_interval_passes(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        now = 1000.0
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+
+        cooldown = Cooldown(60)
+        cooldown.trigger()
+        assert not cooldown.ready()
+
+        now += 59.9
+        assert not cooldown.ready()
+
+        now += 0.1
+        assert cooldown.ready()
+
+    def test_trigger_restarts_interval(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        now = 1000.0
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+
+        cooldown = Cooldown(60)
+        cooldown.trigger()
+        now += 60
+        cooldown.trigger()
+        assert not cooldown.ready()
+
+
+def _nudge(i: int) -> Nudge:
+    return Nudge(
+        nudge_type=NudgeType.INTERRUPT_FREQUENCY,
+        message=f"message {i}",
+        suggestion=f"suggestion {i}",
+    )
+
+
+async def _history(db: Database) -> list[str]:
+    rows = await db.fetch_all("SELECT nudge_content FROM nudge_history ORDER BY id")
+    return [row["nudge_content"] for row in rows]
+
+
+class TestNudgeQueue:
+    async def test_flushes_when_batch_is_full(self, db: Database) -> None:
+        queue = NudgeQueue(db)
+
+        for i in range(nudge_system.NUDGE_FLUSH_BATCH_SIZE - 1):
+            await queue.put(_nudge(i))
+        assert await _history(db) == []
+        assert len(queue) == nudge_system.NUDGE_FLUSH_BATCH_SIZE - 1
+
+        await queue.put(_nudge(99))
+        history = await _history(db)
+        assert len(history) == nudge_system.NUDGE_FLUSH_BATCH_SIZE
+        assert history[0] == "message 0\nsuggestion 0"
+        assert history[-1] == "message 99\nsuggestion 99"
+        assert len(queue) == 0
+
+    async def test_flushes_after_delay(
+        self, db: Database, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(nudge_system, "NUDGE_FLUSH_DELAY_SECONDS", 0.01)
+        queue = NudgeQueue(db)
+
+        await queue.put(_nudge(1))
+        await queue.put(_nudge(2))
+        assert await _history(db) == []
+
+        await asyncio.sleep(0.05)
+        assert await _history(db) == ["message 1\nsuggestion 1", "message 2\nsuggestion 2"]
+        assert len(queue) == 0
+
+    async def test_explicit_flush_cancels_timer(
+        self, db: Database, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(nudge_system, "NUDGE_FLUSH_DELAY_SECONDS", 0.01)
+        queue = NudgeQueue(db)
+
+        await queue.put(_nudge(1))
+        await queue.flush()
+        await asyncio.sleep(0.05)
+        assert await _history(db) == ["message 1\nsuggestion 1"]
+
+    async def test_without_db_drops_nudges(self) -> None:
+        queue = NudgeQueue()
+        await queue.put(_nudge(1))
+        assert len(queue) == 0
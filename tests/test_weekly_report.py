@@ -0,0 +1,75 @@
+"""Tests for saving and loading weekly reports."""
+
+from __future__ import annotations
+
+import json
+import zlib
+from datetime import datetime, timedelta
+
+from captains_log.optimization.weekly_report import WeeklyReportGenerator
+from captains_log.storage.database import Database
+
+WEEK = datetime(2026, 3, 2)
+
+
+async def _add_activity(db: Database) -> None:
+    rows = []
+    for day in range(5):
+        start = WEEK + timedelta(days=day, hours=10)
+        rows += [
+            {"timestamp": start.isoformat(), "app_name": "Zoom"},
+            {"timestamp": (start + timedelta(minutes=45)).isoformat(), "app_name": "Zoom"},
+            {"timestamp": (start + timedelta(minutes=46)).isoformat(), "app_name": "Code"},
+        ]
+    await db.insert_many("activity_logs", rows)
+
+
+async def test_saved_report_round_trips(db: Database) -> None:
+    await _add_activity(db)
+    report = await WeeklyReportGenerator(db=db).generate_report(WEEK)
+
+    row = await db.fetch_one(
+        "SELECT content FROM weekly_optimization_insights WHERE week_start = ?",
+        (WEEK.strftime("%Y-%m-%d"),),
+    )
+    assert row is not None
+    assert isinstance(row["content"], bytes)
+    assert json.loads(zlib.decompress(row["content"]))["total_meetings"] == 5
+
+    loaded = await WeeklyReportGenerator(db=db).get_report(WEEK)
+    assert loaded is not None
+    # daily_stats are not restored from saved content
+    assert loaded.to_dict() == {**report.to_dict(), "daily_stats": {}}
+
+
+async def test_cached_report_is_not_shared(db: Database) -> None:
+    generator = WeeklyReportGenerator(db=db)
+    await generator.generate_report(WEEK)
+
+    first = await generator.get_report(WEEK)
+    assert first is not None
+    first.insights.clear()
+    first.total_meetings = 99
+
+    second = await generator.get_report(WEEK)
+    assert second is not None
+    assert second.total_meetings == 0
+    assert second is not first
+
+
+async def test_save_many_overwrites_stored_weeks(db: Database) -> None:
+    weeks = [WEEK - timedelta(days=7 * i) for i in range(3)]
+    generator = WeeklyReportGenerator(db=db)
+    await generator.generate_report(weeks[0])
+
+    await _add_activity(db)
+    reports = [await generator.generate_report(week, save=False) for week in weeks]
+    await generator.save_many(reports)
+
+    row = await db.fetch_one("SELECT COUNT(*) AS n FROM weekly_optimization_insights")
+    assert row is not None
+    assert row["n"] == len(weeks)
+
+    loaded = await WeeklyReportGenerator(db=db).get_reports(weeks)
+    assert sorted(loaded) == sorted(week.strftime("%Y-%m-%d") for week in weeks)
+    assert loaded[WEEK.strftime("%Y-%m-%d")].total_meetings == 5